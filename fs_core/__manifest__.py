@@ -19,6 +19,7 @@ This module provides:
 * Security groups (User, Instructor, Manager, Admin)
 * Central configuration settings
 * Module category definition
+* Background job queue with cron workers
 
 Other Flight School modules depend on this for security and settings.
 Available modules: Fleet, People, Training, etc.
@@ -38,11 +39,13 @@ Available modules: Fleet, People, Training, etc.
         # Data
         'data/fs_core_data.xml',
         'data/fs_department_data.xml',
+        'data/fs_job_cron.xml',
         # Views
         'views/res_config_settings_views.xml',
         'views/fs_department_views.xml',
         'views/res_users_views.xml',
         'views/res_groups_privilege_views.xml',
+        'views/fs_job_views.xml',
         'views/menu_views.xml',
     ],
     'demo': [],
@@ -3,4 +3,6 @@
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
 
 from . import fs_department
+from . import fs_image_normalize_mixin
 from . import res_config_settings
+from . import fs_job
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+# Part of Flight School Management System
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+import base64
+import binascii
+import io
+import logging
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from PIL import Image, ImageOps
+
+from odoo import api, models
+from odoo.tools import config, str2bool
+
+_logger = logging.getLogger(__name__)
+
+# Longest side of an A4 page in inches, turns the configured DPI into pixels
+A4_LONG_SIDE_INCHES = 11.69
+# Smaller batches are normalized in-process, a pool is not worth starting
+IMAGE_POOL_MIN_BATCH = 4
+# Output format code -> (PIL format, file extension)
+IMAGE_OUTPUT_FORMATS = {
+    'jpeg': ('JPEG', '.jpg'),
+    'webp': ('WEBP', '.webp'),
+}
+# Raster formats that are normalized; others (GIF, PDF, ...) are stored as-is
+IMAGE_INPUT_FORMATS = ('JPEG', 'MPO', 'PNG', 'BMP', 'TIFF', 'WEBP')
+
+
+def normalize_image(data, size, quality, output_format):
+    """Auto-rotate, downsample and re-encode raw image bytes.
+
+    Module-level so it can run in a worker process. Returns
+    ``(data, output_format)``, or ``(data, None)`` when the input is not a
+    supported image or re-encoding would not make it smaller.
+    """
+    try:
+        image = Image.open(io.BytesIO(data))
+        if image.format not in IMAGE_INPUT_FORMATS:
+            return data, None
+        rotated = image.getexif().get(0x0112, 1) != 1
+        image = ImageOps.exif_transpose(image)
+        resized = image.width > size[0] or image.height > size[1]
+        if resized:
+            image.thumbnail(size, Image.Resampling.LANCZOS)
+        if image.mode not in ('RGB', 'L'):
+            # Flatten transparency on white, as for a scanned page
+            image = image.convert('RGBA')
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            image = background
+        output = io.BytesIO()
+        pil_format = IMAGE_OUTPUT_FORMATS[output_format][0]
+        if pil_format == 'JPEG':
+            image.save(output, pil_format, quality=quality, optimize=True, progressive=True)
+        else:
+            image.save(output, pil_format, quality=quality, method=4)
+    except (OSError, ValueError, Image.DecompressionBombError) as exc:
+        _logger.info("Image left unchanged, normalization failed: %s", exc)
+        return data, None
+    result = output.getvalue()
+    if not rotated and not resized and len(result) >= len(data):
+        return data, None
+    return result, output_format
+
+
+class FsImageNormalizeMixin(models.AbstractModel):
+    """Normalize uploaded images before they reach the filestore.
+
+    Inheriting models list their binary fields in
+    ``_fs_normalized_image_fields``. On create and write, images in those
+    fields are auto-rotated, downsampled to the configured DPI (and to the
+    field's max_width/max_height for Image fields) and re-encoded. Large
+    batches are spread over a process pool. Originals can be kept in
+    compressed bundles in a cold-storage directory, outside the filestore.
+    """
+
+    _name = 'fs.image.normalize.mixin'
+    _description = 'Image Upload Normalization'
+
+    _fs_normalized_image_fields = ()
+
+    @api.model
+    def _get_image_normalize_params(self):
+        """Settings of the normalization, or None when it is disabled."""
+        ICP = self.env['ir.config_parameter'].sudo()
+        if not str2bool(ICP.get_param('flight_school.image_normalize')):
+            return None
+        output_format = ICP.get_param('flight_school.image_format', 'jpeg')
+        return {
+            'max_side': int(int(ICP.get_param('flight_school.image_dpi', 150)) * A4_LONG_SIDE_INCHES),
+            'quality': int(ICP.get_param('flight_school.image_quality', 80)),
+            'output_format': output_format if output_format in IMAGE_OUTPUT_FORMATS else 'jpeg',
+            'keep_original': str2bool(ICP.get_param('flight_school.image_keep_original', 'False')),
+            'workers': int(ICP.get_param('flight_school.image_workers', 1)),
+        }
+
+    @api.model
+    def _get_image_size_limit(self, field_name, max_side):
+        """Bounding box for a field, capped by Image field limits."""
+        field = self._fields[field_name]
+        return (
+            min(max_side, getattr(field, 'max_width', 0) or max_side),
+            min(max_side, getattr(field, 'max_height', 0) or max_side),
+        )
+
+    @api.model
+    def _normalize_image_vals_list(self, vals_list):
+        """Normalize the images of ``vals_list`` in place.
+
+        Returns the originals to keep as ``[(index, field_name, data)]``.
+        """
+        params = self._get_image_normalize_params()
+        if not params:
+            return []
+        jobs = []
+        for index, vals in enumerate(vals_list):
+            for field_name in self._fs_normalized_image_fields:
+                if not vals.get(field_name):
+                    continue
+                try:
+                    data = base64.b64decode(vals[field_name], validate=True)
+                except (binascii.Error, TypeError, ValueError):
+                    continue
+                jobs.append((index, field_name, data))
+        if not jobs:
+            return []
+
+        args = [
+            (data, self._get_image_size_limit(field_name, params['max_side']),
+             params['quality'], params['output_format'])
+            for __, field_name, data in jobs
+        ]
+        if params['workers'] > 1 and len(jobs) >= IMAGE_POOL_MIN_BATCH:
+            with ProcessPoolExecutor(max_workers=min(params['workers'], len(jobs))) as pool:
+                results = list(pool.map(normalize_image, *zip(*args)))
+        else:
+            results = [normalize_image(*arg) for arg in args]
+
+        originals = []
+        for (index, field_name, data), (result, output_format) in zip(jobs, results):
+            if not output_format:
+                continue
+            vals_list[index][field_name] = base64.b64encode(result)
+            self._on_image_normalized(vals_list[index], field_name, output_format)
+            if params['keep_original']:
+                originals.append((index, field_name, data))
+        return originals
+
+    @api.model
+    def _on_image_normalized(self, vals, field_name, output_format):
+        """Hook called after ``vals[field_name]`` was re-encoded to ``output_format``."""
+
+    @api.model
+    def _get_original_images_dir(self):
+        """Cold-storage directory of the original uploads of this database."""
+        path = (self.env['ir.config_parameter'].sudo().get_param('flight_school.image_original_path')
+                or os.path.join(config['data_dir'], 'fs_image_originals', self.env.cr.dbname))
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def _keep_original_images(self, originals):
+        """Write original uploads to a cold-storage bundle, by record index in ``self``.
+
+        The bundle is written once the transaction commits, so rolled back
+        uploads leave nothing behind. Entries are named ``<id>/<field>``.
+        """
+        if not originals:
+            return
+        entries = [(f"{self[index].id}/{field_name}", data) for index, field_name, data in originals]
+        bundle_name = f"{self._table}-{datetime.now():%Y%m%d-%H%M%S-%f}.zip"
+        path = os.path.join(self._get_original_images_dir(), bundle_name)
+
+        @self.env.cr.postcommit.add
+        def write_bundle():
+            with zipfile.ZipFile(path + '.tmp', 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=9) as bundle:
+                for name, data in entries:
+                    bundle.writestr(name, data)
+            os.replace(path + '.tmp', path)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        originals = self._normalize_image_vals_list(vals_list)
+        records = super().create(vals_list)
+        records._keep_original_images(originals)
+        return records
+
+    def write(self, vals):
+        if not any(vals.get(field_name) for field_name in self._fs_normalized_image_fields):
+            return super().write(vals)
+        vals = dict(vals)
+        originals = self._normalize_image_vals_list([vals])
+        res = super().write(vals)
+        self._keep_original_images([
+            (index, field_name, data)
+            for index in range(len(self))
+            for __, field_name, data in originals
+        ])
+        return res
@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+# Part of Flight School Management System
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+import logging
+import time
+import traceback
+from datetime import timedelta
+
+from odoo import api, fields, models
+from odoo.exceptions import UserError
+from odoo.tools import SQL, split_every
+from odoo.tools.sql import create_index
+
+_logger = logging.getLogger(__name__)
+
+# Retry delay is JOB_RETRY_BASE_SECONDS * 2 ** (attempt - 1), capped
+JOB_RETRY_BASE_SECONDS = 60
+JOB_RETRY_MAX_SECONDS = 3600
+# Running jobs not finished after this long are considered lost (worker killed)
+JOB_STALE_MINUTES = 60
+# Wall-clock budget of one cron worker run
+JOB_WORKER_TIME_BUDGET = 240
+# Finished jobs kept for this many days
+JOB_KEEP_DAYS = 30
+
+
+class FsJob(models.Model):
+    """Database-backed background job.
+
+    A job calls ``method_name`` on ``model_name`` records with stored
+    arguments, as the user who enqueued it. Jobs are claimed with
+    ``SELECT ... FOR UPDATE SKIP LOCKED`` so any number of cron workers can
+    run side by side, and failing jobs are retried with exponential backoff.
+
+    Usage::
+
+        self.env['fs.job'].enqueue(records, '_heavy_method', arg, name="...")
+    """
+
+    _name = 'fs.job'
+    _description = 'Flight School Background Job'
+    _order = 'id desc'
+
+    name = fields.Char(
+        string='Description',
+        required=True,
+    )
+    model_name = fields.Char(
+        string='Model',
+        required=True,
+    )
+    method_name = fields.Char(
+        string='Method',
+        required=True,
+    )
+    record_ids = fields.Json(
+        string='Record IDs',
+    )
+    args = fields.Json(
+        string='Arguments',
+    )
+    kwargs = fields.Json(
+        string='Keyword Arguments',
+    )
+    user_id = fields.Many2one(
+        comodel_name='res.users',
+        string='Enqueued By',
+        required=True,
+        default=lambda self: self.env.user,
+        ondelete='cascade',
+    )
+    state = fields.Selection(
+        selection=[
+            ('pending', 'Pending'),
+            ('running', 'Running'),
+            ('done', 'Done'),
+            ('failed', 'Failed'),
+            ('cancelled', 'Cancelled'),
+        ],
+        string='Status',
+        required=True,
+        default='pending',
+        index=True,
+    )
+    priority = fields.Integer(
+        string='Priority',
+        default=10,
+        help="Lower runs first.",
+    )
+    eta = fields.Datetime(
+        string='Run After',
+        help="The job is not started before this time.",
+    )
+    attempts = fields.Integer(
+        string='Attempts',
+        default=0,
+        readonly=True,
+    )
+    max_attempts = fields.Integer(
+        string='Max Attempts',
+        default=5,
+    )
+    progress = fields.Float(
+        string='Progress (%)',
+        readonly=True,
+    )
+    progress_message = fields.Char(
+        string='Progress',
+        readonly=True,
+    )
+    date_started = fields.Datetime(
+        string='Started',
+        readonly=True,
+    )
+    date_done = fields.Datetime(
+        string='Finished',
+        readonly=True,
+    )
+    result = fields.Text(
+        string='Result',
+        readonly=True,
+    )
+    error = fields.Text(
+        string='Error',
+        readonly=True,
+    )
+
+    def init(self):
+        # Partial index serving the claim query
+        create_index(
+            self.env.cr, 'fs_job_pending_idx', self._table,
+            ['priority', 'eta', 'id'], where="state = 'pending'",
+        )
+
+    # === Enqueue ===
+
+    @api.model
+    def enqueue(self, records, method_name, *args, name=None, priority=10, eta=None, max_attempts=5, **kwargs):
+        """Queue ``records.method_name(*args, **kwargs)`` and return the job.
+
+        ``records`` may be a recordset or an empty model. Arguments must be
+        JSON serializable. The worker cron is triggered so the job starts
+        as soon as a cron worker is free.
+        """
+        if not hasattr(records, method_name):
+            raise UserError(f"{records._name} has no method {method_name}.")
+        job = self.sudo().create({
+            'name': name or f"{records._name}.{method_name}",
+            'model_name': records._name,
+            'method_name': method_name,
+            'record_ids': records.ids,
+            'args': list(args),
+            'kwargs': kwargs,
+            'user_id': self.env.uid,
+            'priority': priority,
+            'eta': eta,
+            'max_attempts': max_attempts,
+        })
+        cron = self.env.ref('fs_core.ir_cron_fs_job_worker', raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger(eta)
+        return job
+
+    # === Progress ===
+
+    @api.model
+    def _report_progress(self, done, total, message=None):
+        """Publish the progress of the job currently running, if any.
+
+        Written through a separate cursor so it is visible while the job's
+        own transaction is still open.
+        """
+        job_id = self.env.context.get('fs_job_id')
+        if not job_id:
+            return
+        progress = min(100.0, 100.0 * done / total) if total else 0.0
+        with self.env.registry.cursor() as cr:
+            cr.execute(
+                "UPDATE fs_job SET progress = %s, progress_message = %s WHERE id = %s",
+                (progress, message or f"{done} / {total}", job_id),
+            )
+
+    @api.model
+    def _iter_chunks(self, records, size=500):
+        """Yield ``records`` in chunks, reporting progress after each one."""
+        total = len(records)
+        done = 0
+        for chunk in split_every(size, records.ids, records.browse):
+            yield chunk
+            done += len(chunk)
+            self._report_progress(done, total)
+
+    # === Workers ===
+
+    @api.model
+    def _claim(self):
+        """Mark the next runnable job as running and return it, or an empty recordset."""
+        self.flush_model()
+        self.env.cr.execute(SQL("""
+            UPDATE fs_job
+               SET state = 'running',
+                   attempts = attempts + 1,
+                   date_started = now() AT TIME ZONE 'UTC',
+                   progress = 0,
+                   progress_message = NULL
+             WHERE id = (
+                SELECT id
+                  FROM fs_job
+                 WHERE state = 'pending'
+                   AND (eta IS NULL OR eta <= now() AT TIME ZONE 'UTC')
+                 ORDER BY priority, eta NULLS FIRST, id
+                 LIMIT 1
+                   FOR UPDATE SKIP LOCKED
+             )
+         RETURNING id
+        """))
+        row = self.env.cr.fetchone()
+        self.invalidate_model()
+        return self.browse(row[0] if row else [])
+
+    def _perform(self):
+        """Run the job's method as its user and return the method result."""
+        self.ensure_one()
+        env = self.env(user=self.user_id, context=dict(self.user_id.context_get(), fs_job_id=self.id))
+        records = env[self.model_name].browse(self.record_ids or [])
+        return getattr(records, self.method_name)(*(self.args or []), **(self.kwargs or {}))
+
+    def _run(self):
+        """Run a claimed job and commit its outcome."""
+        self.ensure_one()
+        cr = self.env.cr
+        # Commit the claim so other workers and the UI see the job running
+        cr.commit()
+        try:
+            with cr.savepoint():
+                result = self._perform()
+                self.env.flush_all()
+        except Exception as exc:  # noqa: BLE001 - stored on the job
+            _logger.warning("Job %s (%s) failed: %s", self.id, self.name, exc)
+            self._handle_failure(traceback.format_exc())
+        else:
+            self.write({
+                'state': 'done',
+                'date_done': fields.Datetime.now(),
+                'progress': 100.0,
+                'result': repr(result)[:10000] if result is not None else False,
+                'error': False,
+            })
+        cr.commit()
+
+    def _handle_failure(self, error):
+        """Reschedule with exponential backoff, or fail after the last attempt."""
+        self.ensure_one()
+        if self.attempts < self.max_attempts:
+            delay = min(JOB_RETRY_BASE_SECONDS * 2 ** (self.attempts - 1), JOB_RETRY_MAX_SECONDS)
+            self.write({
+                'state': 'pending',
+                'eta': fields.Datetime.now() + timedelta(seconds=delay),
+                'error': error,
+            })
+        else:
+            self.write({
+                'state': 'failed',
+                'date_done': fields.Datetime.now(),
+                'error': error,
+            })
+
+    @api.model
+    def _requeue_stale(self):
+        """Put back jobs whose worker died while running them."""
+        limit = fields.Datetime.now() - timedelta(minutes=JOB_STALE_MINUTES)
+        for job in self.search([('state', '=', 'running'), ('date_started', '<', limit)]):
+            job._handle_failure("Job did not finish within %s minutes." % JOB_STALE_MINUTES)
+
+    @api.model
+    def _cron_run_jobs(self):
+        """Worker: run pending jobs until none is left or the time budget is spent.
+
+        Several crons may call this concurrently; they never claim the same job.
+        """
+        self._requeue_stale()
+        self.env.cr.commit()
+        deadline = time.monotonic() + JOB_WORKER_TIME_BUDGET
+        while time.monotonic() < deadline:
+            job = self._claim()
+            if not job:
+                break
+            job._run()
+
+    @api.autovacuum
+    def _gc_finished_jobs(self):
+        """Delete finished jobs older than JOB_KEEP_DAYS."""
+        limit = fields.Datetime.now() - timedelta(days=JOB_KEEP_DAYS)
+        self.search([
+            ('state', 'in', ('done', 'cancelled')),
+            ('date_done', '<', limit),
+        ]).unlink()
+
+    # === Actions ===
+
+    def action_requeue(self):
+        """Put failed or cancelled jobs back in the queue."""
+        self.filtered(lambda job: job.state in ('failed', 'cancelled')).write({
+            'state': 'pending',
+            'attempts': 0,
+            'eta': False,
+            'date_done': False,
+        })
+        cron = self.env.ref('fs_core.ir_cron_fs_job_worker', raise_if_not_found=False)
+        if cron:
+            cron.sudo()._trigger()
+
+    def action_cancel(self):
+        """Cancel jobs that have not started."""
+        self.filtered(lambda job: job.state == 'pending').write({
+            'state': 'cancelled',
+            'date_done': fields.Datetime.now(),
+        })
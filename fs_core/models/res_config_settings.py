@@ -94,3 +94,51 @@ class ResConfigSettings(models.TransientModel):
         config_parameter='flight_school.maintenance_warning_hours',
         help="Hours before maintenance is due to show warnings.",
     )
+
+    # === Image Uploads ===
+    fs_image_normalize = fields.Boolean(
+        string='Normalize Uploaded Images',
+        default=True,
+        config_parameter='flight_school.image_normalize',
+        help="Auto-rotate, downsample and re-encode photos and scanned documents on upload.",
+    )
+    fs_image_dpi = fields.Integer(
+        string='Image Resolution (DPI)',
+        default=150,
+        config_parameter='flight_school.image_dpi',
+        help="Scanned documents are downsampled to this resolution on an A4 page.",
+    )
+    fs_image_quality = fields.Integer(
+        string='Image Quality',
+        default=80,
+        config_parameter='flight_school.image_quality',
+        help="Encoder quality from 1 to 100.",
+    )
+    fs_image_format = fields.Selection(
+        selection=[
+            ('jpeg', 'Optimized JPEG'),
+            ('webp', 'WebP'),
+        ],
+        string='Image Format',
+        default='jpeg',
+        config_parameter='flight_school.image_format',
+    )
+    fs_image_keep_original = fields.Boolean(
+        string='Keep Original Images',
+        config_parameter='flight_school.image_keep_original',
+        help="Keep the original upload in a compressed bundle in cold storage, outside the filestore.",
+    )
+    fs_image_workers = fields.Integer(
+        string='Image Worker Processes',
+        default=1,
+        config_parameter='flight_school.image_workers',
+        help="Processes used to normalize bulk uploads. 1 normalizes in the request process.",
+    )
+
+    # === Document Search ===
+    fs_text_extraction_workers = fields.Integer(
+        string='Text Extraction Worker Processes',
+        default=1,
+        config_parameter='flight_school.text_extraction_workers',
+        help="Processes used to extract document text for full-text search. 1 extracts in the job process.",
+    )
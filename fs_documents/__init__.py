@@ -2,5 +2,6 @@
 # Part of Flight School Management System
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
 
+from . import controllers
 from . import models
 from . import wizard
@@ -37,8 +37,11 @@ This module provides:
         # Data
         'data/fs_document_entity_type_data.xml',
         'data/fs_document_type_data.xml',
+        'data/fs_documents_cron.xml',
         # Wizards
         'wizard/fs_document_upload_wizard_views.xml',
+        'wizard/fs_document_attach_wizard_views.xml',
+        'wizard/fs_document_zip_import_wizard_views.xml',
         # Views
         'views/fs_documents_dashboard_views.xml',
         'views/fs_document_type_views.xml',
@@ -55,6 +58,8 @@ This module provides:
         'web.assets_backend': [
             'fs_documents/static/src/css/document_view.css',
             'fs_documents/static/src/js/document_resizer.js',
+            'fs_documents/static/src/js/fs_pdf_viewer.js',
+            'fs_documents/static/src/xml/fs_pdf_viewer.xml',
         ],
     },
     'demo': [
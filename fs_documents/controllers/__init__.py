@@ -0,0 +1,5 @@
+# -*- coding: utf-8 -*-
+# Part of Flight School Management System
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+from . import main
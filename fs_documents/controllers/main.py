@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+# Part of Flight School Management System
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+from odoo import http
+from odoo.http import request
+
+
+class FsDocumentController(http.Controller):
+
+    @http.route('/fs_documents/version/<int:version_id>/content', type='http', auth='user', readonly=True)
+    def version_content(self, version_id, download=False, unique=None, **kwargs):
+        """Serve the file of a document version.
+
+        Filestore files are sent with conditional and ``Range`` support
+        (HTTP 206), so the PDF viewer only fetches the byte ranges of the
+        pages it displays.
+        """
+        version = request.env['fs.document.version'].browse(version_id).exists()
+        if not version or not version.has_access('read'):
+            raise request.not_found()
+        stream = request.env['ir.binary']._get_stream_from(version, 'file')
+        return stream.get_response(as_attachment=bool(download), immutable=bool(unique))
@@ -2,8 +2,10 @@
 # Part of Flight School Management System
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
 
+from collections import defaultdict
 from datetime import timedelta
 from odoo import api, fields, models
+from odoo.exceptions import UserError
 
 
 class FsDocument(models.Model):
@@ -125,6 +127,16 @@ class FsDocument(models.Model):
         related='current_version_id.file_type',
         readonly=True,
     )
+    preview_image = fields.Image(
+        string='Preview',
+        related='current_version_id.preview_image',
+        readonly=True,
+    )
+    checksum = fields.Char(
+        string='Checksum',
+        related='current_version_id.checksum',
+        readonly=True,
+    )
 
     # === Computed Status ===
     expiry_status = fields.Selection(
@@ -146,6 +158,12 @@ class FsDocument(models.Model):
         string='Active',
         default=True,
     )
+    content_search = fields.Char(
+        string='Content',
+        compute='_compute_content_search',
+        search='_search_content_search',
+        help="Search the text of every version of the document.",
+    )
 
     # === Computed Entity Info for Views ===
     related_entity_name = fields.Char(
@@ -167,6 +185,16 @@ class FsDocument(models.Model):
         store=True,
     )
 
+    def _compute_content_search(self):
+        self.content_search = False
+
+    def _search_content_search(self, operator, value):
+        """Match documents with a version whose text matches ``value`` (GIN-indexed)."""
+        if operator not in ('ilike', 'like', '=') or not isinstance(value, str):
+            raise UserError("Content search only supports 'contains' with a text value.")
+        # Subquery: matching ids never leave the database
+        return [('version_ids', 'any', self.env['fs.document.version']._search_content(value))]
+
     @api.depends('student_id', 'instructor_id', 'pilot_id', 'training_class_id', 'admin_task_id', 'class_type_id')
     def _compute_related_entity_info(self):
         """Compute the name and type of the related entity for unified display."""
@@ -271,7 +299,13 @@ class FsDocument(models.Model):
         return result
 
     def sync_expiry_to_related(self):
-        """Sync document expiry date to the related entity's field."""
+        """Sync document expiry date to the related entity's field.
+
+        Entities are grouped by (model, expiry field, date) so a bulk upload
+        performs one write per group instead of one per document, and
+        entities already holding the date are skipped.
+        """
+        latest = {}
         for record in self:
             doc_type = record.document_type_id
             if not doc_type.expiry_field or not record.expiry_date:  # type: ignore
@@ -283,8 +317,17 @@ class FsDocument(models.Model):
                 record.pilot_id or 
                 record.training_class_id
             )
-            if related_entity and hasattr(related_entity, doc_type.expiry_field):  # type: ignore
-                related_entity.write({doc_type.expiry_field: record.expiry_date})  # type: ignore
+            expiry_field = doc_type.expiry_field  # type: ignore
+            if related_entity and expiry_field in related_entity._fields:
+                # The last document of the batch wins for a given entity field
+                latest[related_entity, expiry_field] = record.expiry_date
+
+        groups = defaultdict(list)
+        for (entity, expiry_field), expiry_date in latest.items():
+            if entity[expiry_field] != expiry_date:
+                groups[entity._name, expiry_field, expiry_date].append(entity.id)
+        for (model_name, expiry_field, expiry_date), entity_ids in groups.items():
+            self.env[model_name].browse(entity_ids).write({expiry_field: expiry_date})
 
     def action_view_versions(self):
         """View version history for this document."""
@@ -316,6 +359,22 @@ class FsDocument(models.Model):
             }
         }
 
+    def action_attach_to_entities(self):
+        """Open the wizard attaching the latest file to other entities."""
+        self.ensure_one()
+        if not self.current_version_id:
+            raise UserError("This document has no file to attach.")
+        return {
+            'name': 'Attach to Other Entities',
+            'type': 'ir.actions.act_window',
+            'res_model': 'fs.document.attach.wizard',
+            'view_mode': 'form',
+            'target': 'new',
+            'context': {
+                'default_version_id': self.current_version_id.id,
+            },
+        }
+
     @api.model
     def get_or_create_for_entity(self, document_type_id, entity_field, entity_id):
         """Find existing document or create new one for entity.
@@ -328,18 +387,36 @@ class FsDocument(models.Model):
         Returns:
             fs.document record (existing or newly created)
         """
-        domain = [
-            ('document_type_id', '=', document_type_id),
-            (entity_field, '=', entity_id),
-        ]
-        existing = self.search(domain, limit=1)
-        if existing:
-            return existing
-        
-        return self.create({
-            'document_type_id': document_type_id,
+        return self.get_or_create_for_entities(entity_field, [(document_type_id, entity_id)])
+
+    @api.model
+    def get_or_create_for_entities(self, entity_field, pairs):
+        """Batch version of :meth:`get_or_create_for_entity`.
+
+        Args:
+            entity_field: field name like 'student_id', 'instructor_id', etc.
+            pairs: iterable of (document_type_id, entity_id)
+
+        Returns:
+            fs.document recordset, one record per distinct pair, in order.
+            Existing documents are found with one search and the missing
+            ones are created with one create.
+        """
+        pairs = list(dict.fromkeys(pairs))
+        if not pairs:
+            return self.browse()
+        existing = self.search([
+            ('document_type_id', 'in', list({type_id for type_id, __ in pairs})),
+            (entity_field, 'in', list({entity_id for __, entity_id in pairs})),
+        ])
+        by_pair = {(doc.document_type_id.id, doc[entity_field].id): doc for doc in existing}
+        missing = [pair for pair in pairs if pair not in by_pair]
+        created = self.create([{
+            'document_type_id': type_id,
             entity_field: entity_id,
-        })
+        } for type_id, entity_id in missing])
+        by_pair.update(zip(missing, created))
+        return self.browse([by_pair[pair].id for pair in pairs])
 
     def action_open_upload_wizard(self):
         """Open the upload wizard, using entity-specific view if context has an entity.
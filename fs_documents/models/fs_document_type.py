@@ -91,6 +91,15 @@ class FsDocumentType(models.Model):
         string='Display Next To Field',
         help="Field on entity form where the document preview icon should appear.",
     )
+    retention_keep_versions = fields.Integer(
+        string='Keep Last Versions',
+        help="Older versions move to cold storage. 0 keeps all versions.",
+    )
+    retention_keep_years = fields.Integer(
+        string='Keep Versions for (Years)',
+        help="Versions uploaded longer ago move to cold storage. 0 keeps them regardless of age. "
+             "When both limits are set, a version is kept if it meets either one.",
+    )
     sequence = fields.Integer(
         string='Sequence',
         default=10,
@@ -106,3 +115,19 @@ class FsDocumentType(models.Model):
         'Document type code must be unique!',
     )
 
+    def action_archive_old_versions(self):
+        """Queue the archival of versions outside the retention policy."""
+        self.env['fs.job'].enqueue(
+            self.env['fs.document.version'], '_archive_old_versions', self.ids,
+            name=f"Archive old versions: {', '.join(self.mapped('name'))}",
+        )
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': "Archival Queued",
+                'message': "Old versions will be moved to cold storage in the background.",
+                'type': 'info',
+                'sticky': False,
+            },
+        }
@@ -2,9 +2,55 @@
 # Part of Flight School Management System
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
 
-import os
 import base64
+import logging
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from odoo import api, fields, models
+from odoo.exceptions import UserError
+from odoo.tools import SQL, config, groupby, split_every
+from odoo.tools.image import image_process
+from odoo.tools.sql import create_index
+from odoo.addons.fs_core.models.fs_image_normalize_mixin import IMAGE_OUTPUT_FORMATS
+
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+_logger = logging.getLogger(__name__)
+
+# Bounding box of generated preview thumbnails
+PREVIEW_SIZE = (256, 256)
+# Versions written per cold-storage bundle
+ARCHIVE_BUNDLE_SIZE = 200
+# Text kept per version for full-text search (a tsvector is limited to 1 MB)
+CONTENT_TEXT_LIMIT = 500000
+# Smaller batches are extracted in-process, a pool is not worth starting
+TEXT_POOL_MIN_BATCH = 4
+# Versions indexed per run of the backfill cron
+TEXT_INDEX_BATCH_SIZE = 500
+# Files held in memory at once while extracting text
+TEXT_EXTRACT_CHUNK_SIZE = 50
+
+
+def extract_text(data, file_type):
+    """Return the text layer of a PDF or the content of a text file.
+
+    Module-level so it can run in a worker process. Scanned images without
+    a text layer yield an empty string (no OCR).
+    """
+    text = ''
+    try:
+        if file_type == 'pdf' and fitz is not None:
+            with fitz.open(stream=data, filetype='pdf') as pdf:
+                text = '\n'.join(page.get_text() for page in pdf)
+        elif file_type == 'other' and b'\x00' not in data[:1024]:
+            text = data.decode('utf-8', errors='ignore')
+    except Exception as exc:  # noqa: BLE001 - unreadable files are indexed empty
+        _logger.info("Text extraction failed: %s", exc)
+    return text[:CONTENT_TEXT_LIMIT]
 
 
 class FsDocumentVersion(models.Model):
@@ -16,8 +62,11 @@ class FsDocumentVersion(models.Model):
 
     _name = 'fs.document.version'
     _description = 'Document Version'
+    _inherit = ['fs.image.normalize.mixin']
     _order = 'version_number desc'
 
+    _fs_normalized_image_fields = ('file',)
+
     document_id = fields.Many2one(
         comodel_name='fs.document',
         string='Document',
@@ -34,9 +83,9 @@ class FsDocumentVersion(models.Model):
     # === File Data ===
     file = fields.Binary(
         string='File',
-        required=True,
         attachment=True,
-        help="The document file (image or PDF).",
+        help="The document file (image or PDF). Required in views unless the "
+             "version is archived to cold storage, which removes the file.",
     )
     filename = fields.Char(
         string='Filename',
@@ -54,9 +103,30 @@ class FsDocumentVersion(models.Model):
     )
     file_size = fields.Integer(
         string='File Size (bytes)',
-        compute='_compute_file_size',
+        compute='_compute_file_metadata',
+        store=True,
+    )
+    mimetype = fields.Char(
+        string='MIME Type',
+        compute='_compute_file_metadata',
         store=True,
     )
+    checksum = fields.Char(
+        string='Checksum',
+        compute='_compute_file_metadata',
+        store=True,
+        index=True,
+        help="SHA-1 of the file content, as stored by the attachment.",
+    )
+    preview_image = fields.Image(
+        string='Preview',
+        compute='_compute_preview_image',
+        store=True,
+        attachment=True,
+        max_width=PREVIEW_SIZE[0],
+        max_height=PREVIEW_SIZE[1],
+        help="Thumbnail of the file: first page of a PDF or the downscaled image.",
+    )
 
     # === Version-specific metadata ===
     expiry_date = fields.Date(
@@ -93,6 +163,41 @@ class FsDocumentVersion(models.Model):
         default=False,
     )
 
+    content_indexed = fields.Boolean(
+        string='Content Indexed',
+        readonly=True,
+        copy=False,
+        index=True,
+        help="The text of the file was extracted into the full-text index.",
+    )
+
+    # === Cold storage ===
+    is_archived = fields.Boolean(
+        string='In Cold Storage',
+        readonly=True,
+        copy=False,
+        index=True,
+        help="The file was moved to a compressed archive bundle and must be restored to be viewed.",
+    )
+    archive_bundle = fields.Char(
+        string='Archive Bundle',
+        readonly=True,
+        copy=False,
+    )
+    archive_date = fields.Datetime(
+        string='Archived On',
+        readonly=True,
+        copy=False,
+    )
+
+    def init(self):
+        # Full-text index of the file content, filled by _index_content
+        self.env.cr.execute("ALTER TABLE fs_document_version ADD COLUMN IF NOT EXISTS content_tsv tsvector")
+        create_index(
+            self.env.cr, 'fs_document_version_content_tsv_idx', self._table,
+            ['content_tsv'], method='gin',
+        )
+
     @api.depends('filename')
     def _compute_file_type(self):
         """Detect file type from extension."""
@@ -112,35 +217,91 @@ class FsDocumentVersion(models.Model):
                 record.file_type = 'other'
 
     @api.depends('file')
-    def _compute_file_size(self):
-        """Compute file size from binary data."""
+    def _compute_file_metadata(self):
+        """Read size, mimetype and checksum from the backing attachments.
+
+        One query for the whole recordset; the file content is never loaded.
+        """
+        stored = self.filtered('id')
+        metadata = {}
+        if stored:
+            attachments = self.env['ir.attachment'].sudo().search_read([
+                ('res_model', '=', self._name),
+                ('res_field', '=', 'file'),
+                ('res_id', 'in', stored.ids),
+            ], ['res_id', 'file_size', 'mimetype', 'checksum'])
+            metadata = {att['res_id']: att for att in attachments}
         for record in self:
-            if record.file:
-                try:
-                    record.file_size = len(base64.b64decode(record.file))
-                except Exception:
-                    record.file_size = 0
-            else:
-                record.file_size = 0
+            att = metadata.get(record.id, {})
+            record.file_size = att.get('file_size', 0)
+            record.mimetype = att.get('mimetype', False)
+            record.checksum = att.get('checksum', False)
+
+    @api.depends('file', 'file_type')
+    def _compute_preview_image(self):
+        """Render a thumbnail once per distinct file content."""
+        previews = {}
+        for record in self:
+            key = (record.checksum, record.file_type)
+            if not record.checksum or key not in previews:
+                previews[key] = record._render_preview()
+            record.preview_image = previews[key]
+
+    def _render_preview(self):
+        """Return the base64 PNG/JPEG thumbnail of the file, or False."""
+        self.ensure_one()
+        content = self.with_context(bin_size=False).file
+        if not content or self.file_type not in ('image', 'pdf'):
+            return False
+        data = base64.b64decode(content)
+        try:
+            if self.file_type == 'pdf':
+                if fitz is None:
+                    return False
+                with fitz.open(stream=data, filetype='pdf') as pdf:
+                    page = pdf[0]
+                    zoom = min(PREVIEW_SIZE[0] / page.rect.width, PREVIEW_SIZE[1] / page.rect.height)
+                    data = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom)).tobytes('png')
+            return base64.b64encode(image_process(data, size=PREVIEW_SIZE))
+        except Exception as exc:  # noqa: BLE001 - corrupt or unsupported files get no preview
+            _logger.info("No preview for document version %s: %s", self.id, exc)
+            return False
+
+    @api.model
+    def _on_image_normalized(self, vals, field_name, output_format):
+        """Keep the filename extension in line with the re-encoded content."""
+        super()._on_image_normalized(vals, field_name, output_format)
+        if field_name == 'file' and vals.get('filename'):
+            vals['filename'] = os.path.splitext(vals['filename'])[0] + IMAGE_OUTPUT_FORMATS[output_format][1]
 
     @api.model_create_multi
     def create(self, vals_list):
         """Create version, auto-increment version number, and set as current."""
         # Detect document IDs being updated to unset their previous current versions
-        doc_ids_to_unset = set()
+        doc_ids_to_unset = {vals['document_id'] for vals in vals_list if vals.get('document_id')}
+
+        # Highest existing version per document, in one query
+        max_versions = {
+            document.id: max_version
+            for document, max_version in self._read_group(
+                [('document_id', 'in', list(doc_ids_to_unset))],
+                ['document_id'], ['version_number:max'],
+            )
+        } if doc_ids_to_unset else {}
+
+        last_vals = {}
         for vals in vals_list:
             doc_id = vals.get('document_id')
             if doc_id:
-                doc_ids_to_unset.add(doc_id)
-                # Auto-set as current version
-                vals['is_current'] = True
-                
                 # Auto-calculate version number if not provided
                 if not vals.get('version_number'):
-                    max_version = self.search([
-                        ('document_id', '=', doc_id),
-                    ], order='version_number desc', limit=1)
-                    vals['version_number'] = (max_version.version_number + 1) if max_version else 1
+                    vals['version_number'] = max_versions.get(doc_id, 0) + 1
+                max_versions[doc_id] = max(max_versions.get(doc_id, 0), vals['version_number'])
+                vals['is_current'] = False
+                last_vals[doc_id] = vals
+        # Auto-set as current version, the last one when a batch has several
+        for vals in last_vals.values():
+            vals['is_current'] = True
 
         # Unset current flag on existing versions for these documents
         if doc_ids_to_unset:
@@ -155,9 +316,42 @@ class FsDocumentVersion(models.Model):
         
         # Sync expiry to parent document's related entity
         records.document_id.sync_expiry_to_related()  # type: ignore
+        records._enqueue_content_indexing()
         
         return records
 
+    @api.model
+    def _get_file_attachment(self, res_model, res_id, res_field='file'):
+        """Return the attachment backing a binary field of a record."""
+        return self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', res_model),
+            ('res_field', '=', res_field),
+            ('res_id', '=', res_id),
+        ], limit=1)
+
+    @api.model
+    def _create_from_attachment(self, vals_list, attachment):
+        """Create versions whose file is the content of ``attachment``.
+
+        The bytes are read once and given to each version's attachment as
+        ``raw``, so they are never base64-encoded. The filestore names blobs
+        by SHA-1, so identical content is stored only once.
+        """
+        raw = attachment.sudo().raw
+        if not raw:
+            raise UserError("The file to attach has no content. Upload it again.")
+        versions = self.create([dict(vals, file=False) for vals in vals_list])
+        self.env['ir.attachment'].sudo().create([{
+            'name': attachment.name,
+            'res_model': self._name,
+            'res_field': 'file',
+            'res_id': version.id,
+            'raw': raw,
+        } for version in versions])
+        versions.invalidate_recordset(['file'])
+        versions.modified(['file'])
+        return versions
+
     def write(self, vals):
         """Update version and sync if expiry changed."""
         if vals.get('is_current'):
@@ -168,7 +362,11 @@ class FsDocumentVersion(models.Model):
                     ('is_current', '=', True),
                 ]).write({'is_current': False})
         
+        if 'file' in vals:
+            vals = dict(vals, content_indexed=False)
         result = super().write(vals)
+        if 'file' in vals:
+            self._enqueue_content_indexing()
         if 'expiry_date' in vals:
             # If this is the current version, sync to related entity
             self.filtered('is_current').document_id.sync_expiry_to_related()  # type: ignore
@@ -177,6 +375,8 @@ class FsDocumentVersion(models.Model):
     def action_set_as_current(self):
         """Make this version the current one."""
         self.ensure_one()
+        if self.is_archived:
+            self._restore_from_archive()
         # Unset current on siblings
         self.search([
             ('document_id', '=', self.document_id.id),
@@ -203,3 +403,205 @@ class FsDocumentVersion(models.Model):
             'target': 'new',
             'context': {'dialog_size': 'extra-large'},
         }
+
+    # === Cold storage ===
+
+    @api.model
+    def _get_archive_dir(self):
+        """Directory of the archive bundles of this database."""
+        path = (self.env['ir.config_parameter'].sudo().get_param('flight_school.document_archive_path')
+                or os.path.join(config['data_dir'], 'fs_documents_archive', self.env.cr.dbname))
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    @api.model
+    def _get_versions_to_archive(self, document_type_ids=None):
+        """IDs of the versions outside the retention policy of their document type.
+
+        The current version is always kept. A version is kept when it is
+        among the last N versions of its document or newer than the
+        configured number of years.
+        """
+        self.flush_model()
+        self.env['fs.document'].flush_model(['document_type_id'])
+        self.env['fs.document.type'].flush_model(['retention_keep_versions', 'retention_keep_years'])
+        type_filter = SQL("AND t.id = ANY(%s)", list(document_type_ids)) if document_type_ids else SQL()
+        self.env.cr.execute(SQL("""
+            SELECT v.id
+              FROM (
+                    SELECT v.id, v.upload_date, v.is_current, v.is_archived, d.document_type_id,
+                           row_number() OVER (PARTITION BY v.document_id ORDER BY v.version_number DESC) AS rank
+                      FROM fs_document_version v
+                      JOIN fs_document d ON d.id = v.document_id
+                   ) v
+              JOIN fs_document_type t ON t.id = v.document_type_id
+             WHERE NOT COALESCE(v.is_current, FALSE)
+               AND NOT COALESCE(v.is_archived, FALSE)
+               AND (COALESCE(t.retention_keep_versions, 0) > 0 OR COALESCE(t.retention_keep_years, 0) > 0)
+               AND (COALESCE(t.retention_keep_versions, 0) = 0 OR v.rank > t.retention_keep_versions)
+               AND (COALESCE(t.retention_keep_years, 0) = 0
+                    OR v.upload_date < (now() AT TIME ZONE 'UTC') - make_interval(years => t.retention_keep_years))
+               %s
+             ORDER BY v.id
+        """, type_filter))
+        return [row[0] for row in self.env.cr.fetchall()]
+
+    def _archive_to_bundle(self):
+        """Move the files of these versions into one new compressed bundle.
+
+        The bundle is fully written before the attachments are deleted;
+        the blobs leave the filestore at the next attachment GC unless
+        another attachment still shares them. Metadata and thumbnails stay.
+        """
+        attachments = self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', self._name),
+            ('res_field', '=', 'file'),
+            ('res_id', 'in', self.ids),
+        ])
+        if not attachments:
+            return self.browse()
+        now = fields.Datetime.now()
+        bundle_name = f"versions-{now:%Y%m%d-%H%M%S}-{attachments[:1].res_id}.zip"
+        path = os.path.join(self._get_archive_dir(), bundle_name)
+        with zipfile.ZipFile(path + '.tmp', 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=9) as bundle:
+            for attachment in attachments:
+                bundle.writestr(str(attachment.res_id), attachment.raw)
+        with open(path + '.tmp', 'rb') as bundle_file:
+            os.fsync(bundle_file.fileno())
+        os.replace(path + '.tmp', path)
+
+        archived = self.browse(attachments.mapped('res_id'))
+        archived.write({
+            'is_archived': True,
+            'archive_bundle': bundle_name,
+            'archive_date': now,
+        })
+        attachments.unlink()
+        archived.invalidate_recordset(['file'])
+        return archived
+
+    def _restore_from_archive(self):
+        """Bring the files of archived versions back into the filestore."""
+        archive_dir = self._get_archive_dir()
+        vals_list = []
+        for bundle_name, versions in groupby(self.filtered('is_archived'), key=lambda v: v.archive_bundle):
+            path = os.path.join(archive_dir, bundle_name)
+            if not os.path.exists(path):
+                raise UserError(f"Archive bundle {bundle_name} is missing from {archive_dir}.")
+            with zipfile.ZipFile(path) as bundle:
+                vals_list.extend({
+                    'name': 'file',
+                    'res_model': self._name,
+                    'res_field': 'file',
+                    'res_id': version.id,
+                    'raw': bundle.read(str(version.id)),
+                } for version in versions)
+        self.env['ir.attachment'].sudo().create(vals_list)
+        restored = self.filtered('is_archived')
+        restored.write({
+            'is_archived': False,
+            'archive_bundle': False,
+            'archive_date': False,
+        })
+        restored.invalidate_recordset(['file'])
+
+    @api.model
+    def _archive_old_versions(self, document_type_ids=None):
+        """Archive every version outside retention, reporting job progress per bundle."""
+        versions = self.browse(self._get_versions_to_archive(document_type_ids))
+        for bundle in self.env['fs.job']._iter_chunks(versions, ARCHIVE_BUNDLE_SIZE):
+            bundle._archive_to_bundle()
+        return len(versions)
+
+    @api.model
+    def _cron_archive_versions(self):
+        """Nightly archival, committing after each bundle."""
+        for bundle in split_every(ARCHIVE_BUNDLE_SIZE, self._get_versions_to_archive(), self.browse):
+            bundle._archive_to_bundle()
+            self.env.cr.commit()
+
+    def action_restore_from_archive(self):
+        """Restore the files of archived versions on demand."""
+        self._restore_from_archive()
+
+    # === Full-text search ===
+
+    def _enqueue_content_indexing(self):
+        """Extract the text of these versions in a background job."""
+        if self:
+            self.env['fs.job'].enqueue(self, '_index_content', name="Index document content", priority=20)
+
+    def _index_content(self):
+        """Fill the full-text index of these versions.
+
+        Content already indexed under the same checksum is copied over;
+        the other files are read and their text extracted chunk by chunk,
+        in a process pool for large batches when configured.
+        """
+        self.env.flush_all()
+        self.env.cr.execute(SQL("""
+            UPDATE fs_document_version v
+               SET content_tsv = src.content_tsv,
+                   content_indexed = TRUE
+              FROM (
+                    SELECT DISTINCT ON (checksum) checksum, content_tsv
+                      FROM fs_document_version
+                     WHERE content_indexed AND checksum IS NOT NULL
+                  ORDER BY checksum, id
+                   ) src
+             WHERE v.id = ANY(%s)
+               AND v.checksum = src.checksum
+         RETURNING v.id
+        """, self.ids))
+        copied = {row[0] for row in self.env.cr.fetchall()}
+        self.invalidate_recordset(['content_indexed'])
+
+        versions = self.filtered(lambda v: v.id not in copied and not v.is_archived)
+        if not versions:
+            return
+        workers = int(self.env['ir.config_parameter'].sudo().get_param(
+            'flight_school.text_extraction_workers', 1))
+        pool = None
+        if workers > 1 and len(versions) >= TEXT_POOL_MIN_BATCH:
+            pool = ProcessPoolExecutor(max_workers=min(workers, len(versions), TEXT_EXTRACT_CHUNK_SIZE))
+        try:
+            # Only one chunk of files is decoded and held in memory at a time
+            for chunk in self.env['fs.job']._iter_chunks(versions, TEXT_EXTRACT_CHUNK_SIZE):
+                files = [
+                    (base64.b64decode(version.with_context(bin_size=False).file or b''), version.file_type)
+                    for version in chunk
+                ]
+                if pool and len(files) >= TEXT_POOL_MIN_BATCH:
+                    texts = list(pool.map(extract_text, *zip(*files)))
+                else:
+                    texts = [extract_text(*file) for file in files]
+                del files
+                self.env.cr.execute(SQL("""
+                    UPDATE fs_document_version v
+                       SET content_tsv = to_tsvector('simple', data.text),
+                           content_indexed = TRUE
+                      FROM unnest(%s::int[], %s::text[]) AS data(id, text)
+                     WHERE v.id = data.id
+                """, chunk.ids, [text.replace('\x00', '') for text in texts]))
+                chunk.invalidate_recordset(['content_indexed', 'file'])
+        finally:
+            if pool:
+                pool.shutdown()
+
+    @api.model
+    def _cron_index_content(self):
+        """Backfill the full-text index of versions not indexed yet."""
+        self.search([
+            ('content_indexed', '=', False),
+            ('is_archived', '=', False),
+        ], limit=TEXT_INDEX_BATCH_SIZE)._index_content()
+
+    @api.model
+    def _search_content(self, text):
+        """Query of the readable versions whose content matches a web-style search."""
+        query = self._search([])
+        query.add_where(SQL(
+            "%s @@ websearch_to_tsquery('simple', %s)",
+            SQL.identifier(query.table, 'content_tsv'), text,
+        ))
+        return query
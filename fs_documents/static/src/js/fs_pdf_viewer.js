@@ -0,0 +1,142 @@
+/** @odoo-module **/
+
+import { Component, useEffect, useRef } from "@odoo/owl";
+import { _t } from "@web/core/l10n/translation";
+import { registry } from "@web/core/registry";
+import { loadPDFJSAssets } from "@web/libs/pdfjs";
+import { standardFieldProps } from "@web/views/fields/standard_field_props";
+
+// Bytes requested per HTTP range request
+const RANGE_CHUNK_SIZE = 65536;
+
+/**
+ * PDF viewer for document versions that loads pages on demand.
+ *
+ * The file is read through a Range-capable route with pdf.js auto-fetch
+ * disabled, and each page is rendered only when it scrolls into view, so
+ * opening a large scan costs the bytes of the visible pages only.
+ *
+ * Use on a many2one to fs.document.version or on the `id` of a version.
+ * The `unique_field` option names a field holding the file checksum, used
+ * to cache the file until its content changes (default: `checksum`).
+ */
+export class FsPdfViewerField extends Component {
+    static template = "fs_documents.PdfViewerField";
+    static props = {
+        ...standardFieldProps,
+        uniqueField: { type: String, optional: true },
+    };
+    static defaultProps = {
+        uniqueField: "checksum",
+    };
+
+    setup() {
+        this.containerRef = useRef("container");
+        this.loadingTask = null;
+        this.observer = null;
+        useEffect(
+            (versionId, unique) => {
+                this.load(versionId, unique);
+                return () => this.destroy();
+            },
+            () => [this.versionId, this.unique]
+        );
+    }
+
+    get versionId() {
+        const value = this.props.record.data[this.props.name];
+        if (Array.isArray(value)) {
+            return value[0];
+        }
+        return value && typeof value === "object" ? value.id : value;
+    }
+
+    get unique() {
+        return this.props.record.data[this.props.uniqueField] || "";
+    }
+
+    async load(versionId, unique) {
+        const container = this.containerRef.el;
+        container.replaceChildren();
+        if (!versionId) {
+            return;
+        }
+        await loadPDFJSAssets();
+        const loadingTask = globalThis.pdfjsLib.getDocument({
+            url: `/fs_documents/version/${versionId}/content?unique=${encodeURIComponent(unique)}`,
+            rangeChunkSize: RANGE_CHUNK_SIZE,
+            disableAutoFetch: true,
+            disableStream: true,
+        });
+        this.loadingTask = loadingTask;
+        let pdf;
+        try {
+            pdf = await loadingTask.promise;
+        } catch {
+            // e.g. 404 for a version whose file is in cold storage
+            if (this.loadingTask === loadingTask) {
+                this.showEmptyState();
+            }
+            return;
+        }
+        if (this.loadingTask !== loadingTask) {
+            return;
+        }
+        // Size every placeholder from the first page, render pages when visible
+        const firstViewport = (await pdf.getPage(1)).getViewport({ scale: 1 });
+        this.observer = new IntersectionObserver(
+            (entries) => {
+                for (const entry of entries) {
+                    if (entry.isIntersecting) {
+                        this.observer.unobserve(entry.target);
+                        this.renderPage(pdf, entry.target);
+                    }
+                }
+            },
+            { root: container, rootMargin: "200px 0px" }
+        );
+        for (let pageNumber = 1; pageNumber <= pdf.numPages; pageNumber++) {
+            const canvas = document.createElement("canvas");
+            canvas.className = "o_fs_pdf_page shadow-sm mb-2";
+            canvas.dataset.page = pageNumber;
+            canvas.style.aspectRatio = `${firstViewport.width} / ${firstViewport.height}`;
+            container.appendChild(canvas);
+            this.observer.observe(canvas);
+        }
+    }
+
+    showEmptyState() {
+        const message = document.createElement("div");
+        message.className = "h-100 d-flex align-items-center justify-content-center text-muted p-4";
+        message.textContent = _t("The file of this version is not available.");
+        this.containerRef.el.replaceChildren(message);
+    }
+
+    async renderPage(pdf, canvas) {
+        const page = await pdf.getPage(Number(canvas.dataset.page));
+        const baseViewport = page.getViewport({ scale: 1 });
+        const scale = (canvas.clientWidth * window.devicePixelRatio) / baseViewport.width;
+        const viewport = page.getViewport({ scale });
+        canvas.style.aspectRatio = `${baseViewport.width} / ${baseViewport.height}`;
+        canvas.width = viewport.width;
+        canvas.height = viewport.height;
+        await page.render({ canvasContext: canvas.getContext("2d"), viewport }).promise;
+    }
+
+    destroy() {
+        this.observer?.disconnect();
+        this.observer = null;
+        this.loadingTask?.destroy();
+        this.loadingTask = null;
+    }
+}
+
+export const fsPdfViewerField = {
+    component: FsPdfViewerField,
+    supportedTypes: ["many2one", "integer"],
+    extractProps: ({ options }) => ({
+        uniqueField: options.unique_field,
+    }),
+};
+
+registry.category("fields").add("fs_pdf_viewer", fsPdfViewerField);
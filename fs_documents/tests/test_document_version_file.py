@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+# Part of Flight School Management System
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+import base64
+
+from odoo.tests import TransactionCase, tagged
+
+PDF_CONTENT = b"%PDF-1.4\n1 0 obj << /Type /Catalog >> endobj\ntrailer << /Root 1 0 R >>\n%%EOF\n"
+
+
+@tagged('post_install', '-at_install')
+class TestDocumentVersionFile(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.document_type = cls.env['fs.document.type'].create({
+            'name': 'Version File Test',
+            'code': 'VFT',
+            'has_expiry': False,
+        })
+        cls.students = cls.env['fs.student'].create([{
+            'name': f'Version File Student {index}',
+            'gender': 'male',
+        } for index in range(3)])
+
+    def _upload(self, student):
+        wizard = self.env['fs.document.upload.wizard'].create({
+            'student_id': student.id,
+            'document_type_id': self.document_type.id,
+            'file': base64.b64encode(PDF_CONTENT),
+            'filename': 'certificate.pdf',
+            'state': 'details',
+        })
+        action = wizard.action_submit()
+        return self.env['fs.document'].browse(action['res_id']).current_version_id
+
+    def test_upload_stores_file(self):
+        """A non-image upload keeps its content, size and checksum."""
+        version = self._upload(self.students[0])
+        self.assertEqual(base64.b64decode(version.file), PDF_CONTENT)
+        self.assertEqual(version.file_size, len(PDF_CONTENT))
+        self.assertTrue(version.checksum)
+
+    def test_attach_to_others_copies_file(self):
+        """Versions created by "Attach to Others" carry the source file."""
+        source = self._upload(self.students[0])
+        wizard = self.env['fs.document.attach.wizard'].create({
+            'version_id': source.id,
+            'document_type_id': self.document_type.id,
+            'entity_type': 'student',
+            'student_ids': [(6, 0, self.students[1:].ids)],
+        })
+        action = wizard.action_attach()
+        documents = self.env['fs.document'].search(action['domain'])
+        self.assertEqual(len(documents), 2)
+        for version in documents.current_version_id:
+            self.assertEqual(base64.b64decode(version.file), PDF_CONTENT)
+            self.assertEqual(version.checksum, source.checksum)
@@ -3,3 +3,5 @@
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
 
 from . import fs_document_upload_wizard
+from . import fs_document_attach_wizard
+from . import fs_document_zip_import_wizard
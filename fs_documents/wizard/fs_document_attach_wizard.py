@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# Part of Flight School Management System
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+from odoo import api, fields, models
+from odoo.exceptions import UserError
+
+# Entity type code -> wizard many2many field, fs.document link field
+ENTITY_FIELDS = {
+    'student': ('student_ids', 'student_id'),
+    'instructor': ('instructor_ids', 'instructor_id'),
+    'pilot': ('pilot_ids', 'pilot_id'),
+    'training_class': ('training_class_ids', 'training_class_id'),
+    'class_type': ('class_type_ids', 'class_type_id'),
+}
+
+
+class FsDocumentAttachWizard(models.TransientModel):
+    """Attach one document version to many entities at once.
+
+    Every created version points at the same stored file.
+    """
+
+    _name = 'fs.document.attach.wizard'
+    _description = 'Attach Document to Entities'
+
+    version_id = fields.Many2one(
+        comodel_name='fs.document.version',
+        string='File',
+        required=True,
+        ondelete='cascade',
+    )
+    document_type_id = fields.Many2one(
+        comodel_name='fs.document.type',
+        string='Document Type',
+        required=True,
+    )
+    entity_type = fields.Selection(
+        selection=[
+            ('student', 'Students'),
+            ('instructor', 'Instructors'),
+            ('pilot', 'Pilots'),
+            ('training_class', 'Training Classes'),
+            ('class_type', 'Class Types'),
+        ],
+        string='Attach To',
+        required=True,
+        default='student',
+    )
+    student_ids = fields.Many2many(
+        comodel_name='fs.student',
+        string='Students',
+    )
+    instructor_ids = fields.Many2many(
+        comodel_name='fs.instructor',
+        string='Instructors',
+    )
+    pilot_ids = fields.Many2many(
+        comodel_name='fs.pilot',
+        string='Pilots',
+    )
+    training_class_ids = fields.Many2many(
+        comodel_name='fs.training.class',
+        string='Training Classes',
+    )
+    class_type_ids = fields.Many2many(
+        comodel_name='fs.class.type',
+        string='Class Types',
+    )
+
+    @api.model
+    def default_get(self, fields_list):
+        res = super().default_get(fields_list)
+        version = self.env['fs.document.version'].browse(res.get('version_id'))
+        if version:
+            document = version.document_id
+            res['document_type_id'] = document.document_type_id.id
+            if document.related_entity_type in ENTITY_FIELDS:
+                res['entity_type'] = document.related_entity_type
+        return res
+
+    def action_attach(self):
+        self.ensure_one()
+        wizard_field, entity_field = ENTITY_FIELDS[self.entity_type]
+        entities = self[wizard_field]
+        if not entities:
+            raise UserError("Please select at least one entity.")
+
+        documents = self.env['fs.document'].get_or_create_for_entities(
+            entity_field, [(self.document_type_id.id, entity_id) for entity_id in entities.ids],
+        ) - self.version_id.document_id
+
+        source = self.version_id
+        Version = self.env['fs.document.version']
+        Version._create_from_attachment([{
+            'document_id': document.id,
+            'filename': source.filename,
+            'reference': source.reference,
+            'issue_date': source.issue_date,
+            'expiry_date': source.expiry_date,
+            'notes': source.notes,
+        } for document in documents], Version._get_file_attachment(Version._name, source.id))
+
+        return {
+            'name': 'Attached Documents',
+            'type': 'ir.actions.act_window',
+            'res_model': 'fs.document',
+            'view_mode': 'list,form',
+            'domain': [('id', 'in', documents.ids)],
+            'target': 'current',
+        }
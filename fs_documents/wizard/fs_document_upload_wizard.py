@@ -378,16 +378,22 @@ class FsDocumentUploadWizard(models.TransientModel):
             }
             document = Document.create(vals)
 
-        # Create new version
-        self.env['fs.document.version'].create({
+        # Create new version from the stored upload, without re-encoding it
+        Version = self.env['fs.document.version']
+        vals = {
             'document_id': document.id,
-            'file': self.file,
             'filename': self.filename,
             'reference': self.reference,
             'issue_date': self.issue_date,
             'expiry_date': self.expiry_date,
             'notes': self.notes,
-        })
+        }
+        attachment = Version._get_file_attachment(self._name, self.id)
+        # Images go through create so they are normalized before being stored
+        if attachment and not (attachment.mimetype or '').startswith('image/'):
+            Version._create_from_attachment([vals], attachment)
+        else:
+            Version.create(dict(vals, file=self.file))
 
         # Open the document
         return {
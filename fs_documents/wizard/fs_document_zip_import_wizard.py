@@ -0,0 +1,264 @@
+# -*- coding: utf-8 -*-
+# Part of Flight School Management System
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+import base64
+import io
+import os
+import zipfile
+from itertools import islice
+
+from odoo import fields, models
+from odoo.exceptions import UserError
+
+# Archive members handled per lookup / create batch
+ZIP_CHUNK_SIZE = 50
+
+# Entity type code -> (person model, fs.document link field)
+ZIP_ENTITY_MODELS = {
+    'student': ('fs.student', 'student_id'),
+    'instructor': ('fs.instructor', 'instructor_id'),
+    'pilot': ('fs.pilot', 'pilot_id'),
+}
+
+
+class FsDocumentZipImportWizard(models.TransientModel):
+    """Bulk document ingestion from a zip archive.
+
+    Members are named ``<service number or callsign>_<type code>.<ext>``,
+    e.g. ``SN12345_MED.pdf``. They are read one batch at a time: each batch
+    resolves its persons and document types with one search each, gets or
+    creates the documents in one go and creates all versions in one create.
+    """
+
+    _name = 'fs.document.zip.import.wizard'
+    _description = 'Document Zip Import Wizard'
+
+    entity_type = fields.Selection(
+        selection=[
+            ('student', 'Students'),
+            ('instructor', 'Instructors'),
+            ('pilot', 'Pilots'),
+        ],
+        string='Attach To',
+        required=True,
+        default='student',
+    )
+    file = fields.Binary(
+        string='Zip Archive',
+        attachment=True,
+    )
+    filename = fields.Char(
+        string='Filename',
+    )
+    state = fields.Selection(
+        selection=[
+            ('upload', 'Upload'),
+            ('done', 'Done'),
+        ],
+        default='upload',
+        required=True,
+    )
+    imported_count = fields.Integer(string='Imported', readonly=True)
+    error_count = fields.Integer(string='Errors', readonly=True)
+    line_ids = fields.One2many(
+        comodel_name='fs.document.zip.import.wizard.line',
+        inverse_name='wizard_id',
+        string='Files',
+        readonly=True,
+    )
+
+    # === Reading ===
+
+    def _iter_members(self, archive):
+        """Yield the file members of the archive, skipping folders and OS metadata."""
+        for info in archive.infolist():
+            basename = os.path.basename(info.filename)
+            if info.is_dir() or not basename or basename.startswith('.') or '__MACOSX/' in info.filename:
+                continue
+            yield info
+
+    def _get_persons_by_callsign(self, callsigns):
+        """Map callsigns to persons with one search.
+
+        Student callsigns live on their class enrollments (the student field
+        is a non-stored compute), the most recent enrollment wins.
+        """
+        if not callsigns:
+            return {}
+        persons = {}
+        if self.entity_type == 'student':
+            enrollments = self.env['fs.student.enrollment'].search(
+                [('callsign', 'in', callsigns)], order='id desc')
+            for enrollment in enrollments:
+                persons.setdefault(enrollment.callsign, enrollment.student_id)
+        else:
+            person_model = ZIP_ENTITY_MODELS[self.entity_type][0]
+            for person in self.env[person_model].search([('callsign', 'in', callsigns)]):
+                persons.setdefault(person.callsign, person)
+        return persons
+
+    def _open_archive_file(self):
+        """Return a binary file object on the uploaded archive.
+
+        The archive is read from its filestore file, so only the central
+        directory and the members being imported are loaded in memory.
+        """
+        attachment = self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', self._name),
+            ('res_field', '=', 'file'),
+            ('res_id', '=', self.id),
+        ], limit=1)
+        if attachment.store_fname:
+            return open(attachment._full_path(attachment.store_fname), 'rb')
+        return io.BytesIO(attachment.raw or b'')
+
+    @staticmethod
+    def _parse_member_name(basename):
+        """Split ``SN12345_MED.pdf`` into ('SN12345', 'MED'), or None."""
+        stem = os.path.splitext(basename)[0]
+        key, sep, code = stem.rpartition('_')
+        if not sep or not key.strip() or not code.strip():
+            return None
+        return key.strip(), code.strip()
+
+    # === Import ===
+
+    def action_import(self):
+        """Read the archive and import its members batch by batch."""
+        self.ensure_one()
+        if not self.with_context(bin_size=True).file:
+            raise UserError("Please upload a zip archive.")
+        archive_file = self._open_archive_file()
+        try:
+            archive = zipfile.ZipFile(archive_file)
+        except zipfile.BadZipFile:
+            archive_file.close()
+            raise UserError("The uploaded file is not a valid zip archive.")
+
+        results = []
+        with archive_file, archive:
+            members = self._iter_members(archive)
+            while True:
+                chunk = list(islice(members, ZIP_CHUNK_SIZE))
+                if not chunk:
+                    break
+                results.extend(self._import_chunk(archive, chunk))
+
+        self.write({
+            'state': 'done',
+            'imported_count': sum(1 for result in results if result['status'] == 'done'),
+            'error_count': sum(1 for result in results if result['status'] == 'error'),
+            'line_ids': [(0, 0, result) for result in results],
+        })
+        return {
+            'type': 'ir.actions.act_window',
+            'res_model': self._name,
+            'res_id': self.id,
+            'view_mode': 'form',
+            'target': 'new',
+        }
+
+    def _import_chunk(self, archive, chunk):
+        """Resolve, create and report one batch of archive members."""
+        person_model, entity_field = ZIP_ENTITY_MODELS[self.entity_type]
+        results = []
+
+        parsed = []
+        for info in chunk:
+            basename = os.path.basename(info.filename)
+            key_code = self._parse_member_name(basename)
+            if not key_code:
+                results.append({
+                    'filename': basename,
+                    'status': 'error',
+                    'message': "Name must look like <service number or callsign>_<type code>.<ext>.",
+                })
+                continue
+            parsed.append((info, basename) + key_code)
+
+        # One lookup per batch for persons and one for document types
+        keys = list({key for __, __, key, __ in parsed})
+        codes = list({code for __, __, __, code in parsed})
+        persons = {}
+        if keys:
+            # Service numbers win over callsigns
+            for person in self.env[person_model].search([('service_number', 'in', keys)]):
+                persons[person.service_number] = person
+            persons.update(self._get_persons_by_callsign([key for key in keys if key not in persons]))
+        doc_types = {}
+        if codes:
+            doc_types = {
+                doc_type.code: doc_type
+                for doc_type in self.env['fs.document.type'].search([('code', 'in', codes)])
+            }
+
+        to_create = []
+        for info, basename, key, code in parsed:
+            person = persons.get(key)
+            doc_type = doc_types.get(code)
+            if not person:
+                message = f"No {self.entity_type} with service number or callsign '{key}'."
+            elif not doc_type:
+                message = f"Unknown document type code '{code}'."
+            elif doc_type.applies_to_ids and self.entity_type not in doc_type.applies_to_ids.mapped('code'):
+                message = f"Document type '{doc_type.name}' does not apply to {self.entity_type}s."
+            else:
+                to_create.append((info, basename, doc_type.id, person.id))
+                continue
+            results.append({'filename': basename, 'status': 'error', 'message': message})
+
+        if not to_create:
+            return results
+
+        documents = self.env['fs.document'].get_or_create_for_entities(
+            entity_field, [(type_id, person_id) for __, __, type_id, person_id in to_create],
+        )
+        by_pair = {(doc.document_type_id.id, doc[entity_field].id): doc for doc in documents}
+        vals_list = []
+        for info, basename, type_id, person_id in to_create:
+            vals_list.append({
+                'document_id': by_pair[type_id, person_id].id,
+                'file': base64.b64encode(archive.read(info)),
+                'filename': basename,
+            })
+
+        Version = self.env['fs.document.version']
+        try:
+            with self.env.cr.savepoint():
+                versions = Version.create(vals_list)
+                Version.flush_model()
+            results.extend({
+                'filename': vals['filename'],
+                'status': 'done',
+                'document_id': version.document_id.id,
+            } for vals, version in zip(vals_list, versions))
+        except Exception:
+            # Retry file by file to isolate the failing ones
+            for vals in vals_list:
+                try:
+                    with self.env.cr.savepoint():
+                        version = Version.create(vals)
+                        Version.flush_model()
+                    results.append({'filename': vals['filename'], 'status': 'done',
+                                    'document_id': version.document_id.id})
+                except Exception as exc:  # noqa: BLE001 - reported per file
+                    results.append({'filename': vals['filename'], 'status': 'error', 'message': str(exc)})
+        return results
+
+
+class FsDocumentZipImportWizardLine(models.TransientModel):
+    _name = 'fs.document.zip.import.wizard.line'
+    _description = 'Document Zip Import Result'
+
+    wizard_id = fields.Many2one('fs.document.zip.import.wizard', ondelete='cascade')
+    filename = fields.Char(string='File')
+    status = fields.Selection(
+        selection=[
+            ('done', 'Imported'),
+            ('error', 'Error'),
+        ],
+        string='Status',
+    )
+    document_id = fields.Many2one('fs.document', string='Document')
+    message = fields.Char(string='Message')
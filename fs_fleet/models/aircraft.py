@@ -12,9 +12,11 @@ class Aircraft(models.Model):
 
     _name = 'fs.aircraft'
     _description = 'Aircraft'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'fs.image.normalize.mixin']
     _order = 'registration'
 
+    _fs_normalized_image_fields = ('image',)
+
     # === Basic Information ===
     registration = fields.Char(
         string='Registration',
@@ -4,7 +4,7 @@
 
 {
     'name': 'Flight School People',
-    'version': '19.0.1.0.1',
+    'version': '19.0.1.1.0',
     'category': 'Aviation/Flight School',
     'summary': 'Personnel management for flight schools',
     'description': """
@@ -45,6 +45,8 @@ All personnel can optionally have Odoo user accounts for system access.
         'views/fs_qualification_type_views.xml',
         'views/fs_english_level_views.xml',
         'views/fs_medical_class_views.xml',
+        # Wizards - referenced from personnel list views
+        'wizard/fs_qualification_renewal_wizard_views.xml',
         # Views - Personnel
         'views/fs_people_dashboard_views.xml',
         'views/fs_instructor_views.xml',
@@ -54,7 +56,16 @@ All personnel can optionally have Odoo user accounts for system access.
         'views/fs_instructor_availability_views.xml',
         'views/fs_admin_staff_views.xml',
         'views/menu_views.xml',
+        # Wizards
+        'wizard/fs_person_import_wizard_views.xml',
+        'wizard/fs_person_duplicate_report_views.xml',
     ],
+    'assets': {
+        'web.assets_backend': [
+            'fs_people/static/src/js/qualification_badges_field.js',
+            'fs_people/static/src/xml/qualification_badges_field.xml',
+        ],
+    },
     'demo': [
         'demo/fs_instructor_demo.xml',
         'demo/fs_pilot_demo.xml',
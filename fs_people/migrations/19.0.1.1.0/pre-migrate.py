@@ -0,0 +1,46 @@
+def migrate(cr, version):
+    """Convert per-day instructor availability rows into intervals.
+
+    Consecutive days with the same instructor, availability and reason are
+    merged into a single interval; the other rows of each run are deleted.
+    """
+    cr.execute("""
+        SELECT column_name
+        FROM information_schema.columns
+        WHERE table_name='fs_instructor_availability'
+        AND column_name='date'
+    """)
+    if not cr.fetchone():
+        return
+
+    cr.execute("""
+        ALTER TABLE fs_instructor_availability
+        DROP CONSTRAINT IF EXISTS fs_instructor_availability_unique_instructor_date
+    """)
+    cr.execute("""
+        ALTER TABLE fs_instructor_availability
+        ADD COLUMN IF NOT EXISTS date_start timestamp,
+        ADD COLUMN IF NOT EXISTS date_end timestamp,
+        ADD COLUMN IF NOT EXISTS recurrence varchar
+    """)
+    cr.execute("""
+        WITH runs AS (
+            SELECT id, instructor_id, is_available, COALESCE(reason, '') AS reason, date,
+                   date - (ROW_NUMBER() OVER (
+                       PARTITION BY instructor_id, is_available, COALESCE(reason, '')
+                       ORDER BY date))::int AS run
+              FROM fs_instructor_availability
+        ), merged AS (
+            SELECT MIN(id) AS id, MIN(date) AS date_from, MAX(date) AS date_to
+              FROM runs
+          GROUP BY instructor_id, is_available, reason, run
+        )
+        UPDATE fs_instructor_availability a
+           SET date_start = m.date_from::timestamp,
+               date_end = (m.date_to + 1)::timestamp,
+               recurrence = 'none'
+          FROM merged m
+         WHERE a.id = m.id
+    """)
+    cr.execute("DELETE FROM fs_instructor_availability WHERE date_start IS NULL")
+    cr.execute("ALTER TABLE fs_instructor_availability DROP COLUMN date")
@@ -6,6 +6,7 @@ from . import fs_license_type
 from . import fs_qualification_type
 from . import fs_english_level
 from . import fs_medical_class
+from . import fs_person_duplicate
 from . import fs_person
 from . import fs_person_qualification
 from . import fs_instructor
@@ -13,5 +14,6 @@ from . import fs_instructor_availability
 from . import fs_student
 from . import fs_pilot
 from . import fs_admin_staff
+from . import fs_personnel_search
 from . import res_users
 from . import fs_people_dashboard
@@ -14,7 +14,7 @@ class FsAdminStaff(models.Model):
     
     _name = 'fs.admin.staff'
     _description = 'Administrative Staff'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'fs.person.duplicate.mixin']
     _order = 'name'
 
     # === Identification ===
@@ -22,9 +22,11 @@ class FsAdminStaff(models.Model):
         string='Full Name',
         required=True,
         tracking=True,
+        index='trigram',
     )
     identification_number = fields.Char(
         string='ID Number',
+        index='trigram',
         help="National ID or passport number.",
     )
     gender = fields.Selection(
@@ -53,6 +55,7 @@ class FsAdminStaff(models.Model):
     )
     service_number = fields.Char(
         string='Service Number',
+        index='trigram',
         help="Military service number.",
     )
     
@@ -23,6 +23,7 @@ class FsInstructor(models.Model):
     # === Callsign ===
     callsign = fields.Char(
         string='Callsign',
+        index='trigram',
         help="Callsign for the instructor.",
     )
     display_name = fields.Char(
@@ -60,34 +61,20 @@ class FsInstructor(models.Model):
         inverse_name='instructor_id',
         string='Qualifications',
     )
-    qualification_badges = fields.Html(
+    qualification_badges = fields.Json(
         string='Qualification Badges',
         compute='_compute_qualification_badges',
-        sanitize=False,
+        help="Qualifications as [code, expiry status] pairs, rendered client-side.",
     )
     
     @api.depends('qualification_ids', 'qualification_ids.qualification_code', 'qualification_ids.expiry_status')
     def _compute_qualification_badges(self):
-        """Compute HTML badges for qualifications with status-based colors."""
-        status_colors = {
-            'valid': '#28a745',      # Green
-            'expiring': '#ffc107',   # Yellow
-            'expired': '#dc3545',    # Red
-            'no_expiry': '#6c757d',  # Gray
-        }
+        """Compute the compact badge payload for the qualifications widget."""
         for record in self:
-            badges = []
-            for qual in record.qualification_ids:
-                color = status_colors.get(qual.expiry_status, '#6c757d')  # type: ignore
-                text_color = '#212529' if qual.expiry_status == 'expiring' else '#ffffff'  # type: ignore
-                badge_html = (
-                    f'<span style="background-color: {color}; color: {text_color}; '
-                    f'padding: 2px 8px; border-radius: 4px; margin-right: 4px; '
-                    f'font-size: 12px; display: inline-block;">'
-                    f'{qual.qualification_code or qual.qualification_id.name}</span>'  # type: ignore
-                )
-                badges.append(badge_html)
-            record.qualification_badges = ''.join(badges) if badges else ''
+            record.qualification_badges = [
+                [qual.qualification_code or qual.qualification_id.name, qual.expiry_status]  # type: ignore
+                for qual in record.qualification_ids
+            ]
 
     def action_view_qualifications(self):
         """Navigate to the detailed qualifications list in a popup."""
@@ -114,34 +101,14 @@ class FsInstructor(models.Model):
         help="The most urgent expiry date among medical, english, and qualifications.",
     )
     
-    @api.depends('qualification_ids.expiry_status', 'qualification_ids.expiry_date', 
-                 'medical_expiry', 'english_expiry')
+    @api.depends('qualification_ids.expiry_status', 'qualification_ids.expiry_date',
+                 'medical_status', 'medical_expiry', 'english_status', 'english_expiry')
     def _compute_has_expired_qualification(self):
         """Check if any qualification or status is expired and find the earliest expiry date."""
-        for record in self:
-            # Check for expiration
-            record.has_expired_qualification = (
-                any(qual.expiry_status == 'expired' for qual in record.qualification_ids) or  # type: ignore
-                getattr(record, 'medical_status', False) == 'expired' or
-                getattr(record, 'english_status', False) == 'expired'
-            )
-            
-            # Find earliest expiry date
-            expiries = []
-            med_exp = getattr(record, 'medical_expiry', False)
-            if med_exp:
-                expiries.append(med_exp)
-            
-            eng_exp = getattr(record, 'english_expiry', False)
-            if eng_exp:
-                expiries.append(eng_exp)
-                
-            for qual in record.qualification_ids:
-                q_exp = getattr(qual, 'expiry_date', False)
-                if q_exp:
-                    expiries.append(q_exp)
-            
-            record.earliest_expiry_date = min(expiries) if expiries else False
+        self._compute_expiry_aggregates('instructor_id', {
+            'medical_status': 'medical_expiry',
+            'english_status': 'english_expiry',
+        })
 
     # === English Proficiency ===
     english_level_id = fields.Many2one(
@@ -2,37 +2,148 @@
 # Part of Flight School Management System
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
 
-from odoo import fields, models
+from datetime import datetime, time, timedelta
+
+import pytz
+
+from odoo import api, fields, models
+from odoo.tools import SQL
+from odoo.tools.sql import create_index
+
+WEEK = timedelta(days=7)
 
 
 class FsInstructorAvailability(models.Model):
-    """Instructor availability records for scheduling."""
+    """Instructor availability intervals for scheduling.
+
+    Each record is a date/time interval, optionally repeated every week.
+    Instructors are available by default: unavailable intervals (leave,
+    meetings...) block them, and an available interval covering the whole
+    requested window overrides a block (e.g. one occurrence of a weekly
+    day off).
+    """
 
     _name = 'fs.instructor.availability'
     _description = 'Instructor Availability'
-    _order = 'date desc, instructor_id'
+    _order = 'date_start desc, instructor_id'
 
     instructor_id = fields.Many2one(
         comodel_name='fs.instructor',
         string='Instructor',
         required=True,
+        index=True,
         ondelete='cascade',
     )
-    date = fields.Date(
-        string='Date',
+    date_start = fields.Datetime(
+        string='From',
         required=True,
-        default=fields.Date.context_today,
+        default=lambda self: fields.Datetime.now().replace(minute=0, second=0, microsecond=0),
+    )
+    date_end = fields.Datetime(
+        string='To',
+        required=True,
+        default=lambda self: fields.Datetime.now().replace(minute=0, second=0, microsecond=0) + timedelta(days=1),
+    )
+    recurrence = fields.Selection(
+        selection=[
+            ('none', 'Does Not Repeat'),
+            ('weekly', 'Weekly'),
+        ],
+        string='Repeat',
+        required=True,
+        default='none',
+    )
+    recurrence_until = fields.Date(
+        string='Repeat Until',
+        help="Last date a weekly interval may start on. Leave empty to repeat indefinitely.",
     )
     is_available = fields.Boolean(
         string='Is Available',
-        default=True,
+        default=False,
     )
     reason = fields.Char(
         string='Reason',
         help="Reason for unavailability (e.g., Leave, Meeting, Sick).",
     )
 
-    _unique_instructor_date = models.Constraint(
-        'UNIQUE(instructor_id, date)',
-        'Availability record already exists for this instructor on this date!',
+    _check_interval = models.Constraint(
+        'CHECK(date_end > date_start)',
+        'The end of an availability interval must be after its start!',
     )
+
+    def init(self):
+        # Overlap lookups on one-off intervals
+        create_index(
+            self.env.cr, 'fs_instructor_availability_period_gist_idx', self._table,
+            ['tsrange(date_start, date_end)'], method='gist',
+            where="recurrence = 'none'",
+        )
+
+    def _get_occurrence(self, start):
+        """Return (start, end) of the first occurrence ending after ``start``, or None."""
+        self.ensure_one()
+        if self.recurrence != 'weekly' or start < self.date_end:
+            occurrence = (self.date_start, self.date_end)
+        else:
+            weeks = (start - self.date_end) // WEEK + 1
+            occurrence = (self.date_start + weeks * WEEK, self.date_end + weeks * WEEK)
+        if self.recurrence == 'weekly' and self.recurrence_until \
+                and occurrence[0].date() > self.recurrence_until:
+            return None
+        return occurrence
+
+    @api.model
+    def _get_intervals_overlapping(self, start, end):
+        """All availability intervals with an occurrence overlapping [start, end)."""
+        self.flush_model()
+        self.env.cr.execute(SQL("""
+            SELECT id FROM fs_instructor_availability
+             WHERE recurrence = 'none'
+               AND tsrange(date_start, date_end) && tsrange(%(start)s, %(end)s)
+             UNION ALL
+            SELECT id FROM fs_instructor_availability
+             WHERE recurrence = 'weekly'
+               AND date_start < %(end)s
+               AND (recurrence_until IS NULL OR recurrence_until >= %(start)s::date - 7)
+        """, start=start, end=end))
+        intervals = self.browse(row[0] for row in self.env.cr.fetchall())
+        return intervals.filtered(lambda interval: (occ := interval._get_occurrence(start)) and occ[0] < end)
+
+    @api.model
+    def _get_day_window(self, date):
+        """Naive UTC bounds [start, end) of the local day ``date``.
+
+        The day is taken in the user's timezone, or the company's when the
+        user has none (e.g. crons).
+        """
+        tz = pytz.timezone(
+            self.env.context.get('tz') or self.env.user.tz or self.env.company.partner_id.tz or 'UTC')
+        start, end = (
+            tz.localize(datetime.combine(day, time.min)).astimezone(pytz.utc).replace(tzinfo=None)
+            for day in (date, date + timedelta(days=1))
+        )
+        return start, end
+
+    @api.model
+    def available_instructors(self, start, end, instructors=None):
+        """Instructors not blocked by an unavailability interval over [start, end).
+
+        Args:
+            start, end: naive UTC datetimes.
+            instructors: optional fs.instructor recordset to restrict the check to;
+                defaults to all active instructors.
+
+        Returns:
+            fs.instructor recordset.
+        """
+        if instructors is None:
+            instructors = self.env['fs.instructor'].search([])
+        blocked, covered = set(), set()
+        for interval in self._get_intervals_overlapping(start, end):
+            if not interval.is_available:
+                blocked.add(interval.instructor_id.id)
+            else:
+                occ_start, occ_end = interval._get_occurrence(start)
+                if occ_start <= start and occ_end >= end:
+                    covered.add(interval.instructor_id.id)
+        return instructors.filtered(lambda instructor: instructor.id not in blocked - covered)
@@ -5,6 +5,7 @@
 from datetime import timedelta
 from odoo import api, fields, models
 from odoo.exceptions import UserError
+from odoo.tools import SQL
 
 
 class FsPerson(models.AbstractModel):
@@ -16,7 +17,9 @@ class FsPerson(models.AbstractModel):
     
     _name = 'fs.person'
     _description = 'Flight School Person (Base)'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['mail.thread', 'mail.activity.mixin', 'fs.person.duplicate.mixin', 'fs.image.normalize.mixin']
+
+    _fs_normalized_image_fields = ('image',)
 
     # === Image ===
     image = fields.Image(
@@ -37,9 +40,11 @@ class FsPerson(models.AbstractModel):
         string='Full Name',
         required=True,
         tracking=True,
+        index='trigram',
     )
     identification_number = fields.Char(
         string='ID Number',
+        index='trigram',
         help="National ID or passport number.",
     )
     gender = fields.Selection(
@@ -82,6 +87,7 @@ class FsPerson(models.AbstractModel):
     )
     service_number = fields.Char(
         string='Service Number',
+        index='trigram',
         help="Military service/personnel number.",
     )
     
@@ -152,6 +158,55 @@ class FsPerson(models.AbstractModel):
         for record in self:
             record.has_user = bool(record.user_id)
     
+    def _compute_expiry_aggregates(self, qualification_column, status_fields):
+        """Set ``has_expired_qualification`` and ``earliest_expiry_date`` in one query.
+
+        Aggregates the person's qualifications with ``bool_or``/``MIN`` and folds
+        in the person's own expiry columns with ``LEAST``.
+
+        Args:
+            qualification_column: column of fs_person_qualification pointing to this model.
+            status_fields: dict {status field: expiry date field} on this model.
+        """
+        stored = self.filtered('id')
+        if stored:
+            self.env['fs.person.qualification'].flush_model(
+                [qualification_column, 'expiry_status', 'expiry_date'])
+            stored.flush_recordset(list(status_fields) + list(status_fields.values()))
+            self.env.cr.execute(SQL("""
+                SELECT p.id,
+                       COALESCE(bool_or(q.expiry_status = 'expired'), FALSE) OR %(own_expired)s,
+                       LEAST(MIN(q.expiry_date), %(own_expiries)s)
+                  FROM %(table)s p
+             LEFT JOIN fs_person_qualification q ON q.%(qualification_column)s = p.id
+                 WHERE p.id = ANY(%(ids)s)
+              GROUP BY p.id
+            """,
+                own_expired=SQL(' OR ').join(
+                    SQL("COALESCE(p.%s = 'expired', FALSE)", SQL.identifier(status))
+                    for status in status_fields),
+                own_expiries=SQL(', ').join(
+                    SQL('p.%s', SQL.identifier(expiry)) for expiry in status_fields.values()),
+                table=SQL.identifier(self._table),
+                qualification_column=SQL.identifier(qualification_column),
+                ids=stored.ids,
+            ))
+            aggregates = {row[0]: row[1:] for row in self.env.cr.fetchall()}
+            for record in stored:
+                has_expired, earliest = aggregates.get(record.id, (False, None))
+                record.has_expired_qualification = has_expired
+                record.earliest_expiry_date = earliest or False
+
+        # Unsaved records (form onchange) are not in the database yet
+        for record in self - stored:
+            record.has_expired_qualification = (
+                'expired' in record.qualification_ids.mapped('expiry_status')  # type: ignore
+                or any(record[status] == 'expired' for status in status_fields)
+            )
+            expiries = record.qualification_ids.mapped('expiry_date') + [  # type: ignore
+                record[expiry] for expiry in status_fields.values()]
+            record.earliest_expiry_date = min(filter(None, expiries), default=False)
+
     def action_create_user(self):
         """Create an Odoo user account for this person."""
         self.ensure_one()
@@ -174,6 +229,56 @@ class FsPerson(models.AbstractModel):
             },
         }
     
+    def action_create_users_batch(self):
+        """Create and link user accounts for all selected persons without one.
+
+        Logins come from ``_suggest_login``; collisions with existing logins
+        (and between the selected persons) get a numeric suffix.
+        """
+        persons = self.filtered(lambda p: not p.user_id)
+        if not persons:
+            raise UserError("All selected persons already have a user account.")
+
+        bases = [person._suggest_login() for person in persons]
+        self.env['res.users'].flush_model(['login'])
+        self.env.cr.execute(SQL("""
+            SELECT login FROM res_users
+             WHERE login = ANY(%s)
+                OR substring(login FROM '^(.*[^0-9])[0-9]+$') = ANY(%s)
+        """, bases, bases))
+        taken = {row[0] for row in self.env.cr.fetchall()}
+        logins = []
+        for base in bases:
+            login, suffix = base, 2
+            while login in taken:
+                login, suffix = f'{base}{suffix}', suffix + 1
+            taken.add(login)
+            logins.append(login)
+
+        group = self.env.ref('fs_core.group_flight_school_user')
+        users = self.env['res.users'].create([{
+            'name': person.name,
+            'login': login,
+            'group_ids': [(4, group.id)],
+        } for person, login in zip(persons, logins)])
+
+        # One write per person, as each gets a different user. The SQL is
+        # flushed as one batched UPDATE and tracking is finalized once at
+        # commit, but each write still runs the write() overrides.
+        for person, user in zip(persons, users):
+            person.write({'user_id': user.id})
+
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': 'User Accounts',
+                'message': f"{len(users)} user account(s) created.",
+                'type': 'success',
+                'next': {'type': 'ir.actions.act_window_close'},
+            },
+        }
+
     def _suggest_login(self):
         """Suggest a login based on the person's name."""
         if self.name:
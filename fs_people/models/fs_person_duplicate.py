@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# Part of Flight School Management System
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+from collections import defaultdict
+
+from odoo import api, fields, models
+from odoo.tools import SQL
+
+# Personnel tables searched for duplicates
+DUPLICATE_MODELS = ('fs.student', 'fs.instructor', 'fs.pilot', 'fs.admin.staff')
+
+# Minimum name similarity (pg_trgm) for a candidate to be reported
+DUPLICATE_NAME_THRESHOLD = 0.5
+# Duplicates shown in the warning of a form
+DUPLICATE_WARNING_LIMIT = 3
+
+
+class FsPersonDuplicateMixin(models.AbstractModel):
+    """Fuzzy duplicate detection shared by all personnel models.
+
+    Names, ID numbers and service numbers carry trigram indexes; candidates
+    are looked up across all personnel tables with a single UNION query.
+    """
+
+    _name = 'fs.person.duplicate.mixin'
+    _description = 'Personnel Duplicate Detection'
+
+    duplicate_warning = fields.Char(
+        string='Possible Duplicates',
+        compute='_compute_duplicate_warning',
+        help="Other personnel records with a similar name or the same ID/service number.",
+    )
+
+    @api.depends('name', 'identification_number', 'service_number')
+    def _compute_duplicate_warning(self):
+        for record in self:
+            candidates = record._find_duplicate_candidates(
+                record.name, record.identification_number, record.service_number,  # type: ignore
+                exclude=(record._name, record._origin.id), limit=DUPLICATE_WARNING_LIMIT * 3,
+            )
+            # Only name records the user may read
+            res_ids = defaultdict(list)
+            for candidate in candidates:
+                res_ids[candidate['model']].append(candidate['res_id'])
+            readable = {
+                (model, res_id)
+                for model, ids in res_ids.items()
+                for res_id in self.env[model].browse(ids)._filtered_access('read').ids
+            }
+            candidates = [c for c in candidates if (c['model'], c['res_id']) in readable]
+            record.duplicate_warning = ', '.join(
+                f"{self.env[c['model']]._description} {c['name']} ({round(c['score'] * 100)}%)"
+                for c in candidates[:DUPLICATE_WARNING_LIMIT]
+            ) or False
+
+    @api.model
+    def _get_duplicate_union_sql(self):
+        """UNION ALL of the active rows of every personnel table."""
+        return SQL(" UNION ALL ").join(
+            SQL(
+                "SELECT %s AS model, id AS res_id, name, identification_number, service_number FROM %s WHERE active",
+                model, SQL.identifier(self.env[model]._table),
+            )
+            for model in DUPLICATE_MODELS
+        )
+
+    @api.model
+    def _get_name_similarity_sql(self, left, right):
+        """Return (match condition, score expression) SQL comparing two names.
+
+        Uses pg_trgm when available, exact case-insensitive match otherwise.
+        """
+        if self.env.registry.has_trigram:
+            # SQL() does not take an escaped "%": pass the operator as its own code
+            return SQL("%s %s %s", left, SQL("%%"), right), SQL("similarity(%s, %s)", left, right)
+        return (
+            SQL("lower(%s) = lower(%s)", left, right),
+            SQL("CASE WHEN lower(%s) = lower(%s) THEN 1.0 ELSE 0.0 END", left, right),
+        )
+
+    @api.model
+    def _find_duplicate_candidates(self, name, identification_number=None, service_number=None,
+                                   exclude=None, limit=10):
+        """Similarity-ranked personnel matching the given identity, across all tables.
+
+        Args:
+            exclude: optional (model, res_id) to leave out, typically the record itself.
+
+        Returns:
+            list of dicts with keys model, res_id, name and score (0..1).
+        """
+        if not (name or identification_number or service_number):
+            return []
+        for model in DUPLICATE_MODELS:
+            self.env[model].flush_model(['name', 'identification_number', 'service_number', 'active'])
+        name_match, name_score = self._get_name_similarity_sql(SQL.identifier('p', 'name'), name or '')
+        id_number = identification_number or None
+        service_number = service_number or None
+        self.env.cr.execute(SQL("""
+            SELECT model, res_id, name, score FROM (
+                SELECT p.model, p.res_id, p.name,
+                       GREATEST(%(name_score)s,
+                                CASE WHEN p.identification_number = %(id_number)s THEN 1.0 ELSE 0.0 END,
+                                CASE WHEN p.service_number = %(service_number)s THEN 1.0 ELSE 0.0 END) AS score
+                  FROM (%(union)s) p
+                 WHERE (%(name_match)s
+                        OR p.identification_number = %(id_number)s
+                        OR p.service_number = %(service_number)s)
+                   AND NOT (p.model = %(exclude_model)s AND p.res_id = %(exclude_id)s)
+            ) candidates
+             WHERE score >= %(threshold)s
+          ORDER BY score DESC, name
+             LIMIT %(limit)s
+        """,
+            name_score=name_score,
+            name_match=name_match,
+            union=self._get_duplicate_union_sql(),
+            id_number=id_number,
+            service_number=service_number,
+            exclude_model=exclude[0] if exclude else '',
+            exclude_id=(exclude[1] or 0) if exclude else 0,
+            threshold=DUPLICATE_NAME_THRESHOLD,
+            limit=limit,
+        ))
+        return self.env.cr.dictfetchall()
+
+    @api.model
+    def _find_duplicate_pairs(self, limit=1000):
+        """All pairs of personnel records that look like the same person.
+
+        Each record is probed against the UNION of all tables through a lateral
+        join, so the trigram indexes are used for every probe.
+
+        Returns:
+            list of dicts with keys model_a, res_id_a, model_b, res_id_b,
+            score, same_id_number and same_service_number.
+        """
+        for model in DUPLICATE_MODELS:
+            self.env[model].flush_model(['name', 'identification_number', 'service_number', 'active'])
+        union = self._get_duplicate_union_sql()
+        name_match, name_score = self._get_name_similarity_sql(
+            SQL.identifier('b', 'name'), SQL.identifier('a', 'name'))
+        self.env.cr.execute(SQL("""
+            SELECT a.model AS model_a, a.res_id AS res_id_a,
+                   m.model AS model_b, m.res_id AS res_id_b,
+                   m.score, m.same_id_number, m.same_service_number
+              FROM (%(union)s) a
+        CROSS JOIN LATERAL (
+                SELECT b.model, b.res_id,
+                       COALESCE(b.identification_number = a.identification_number, FALSE) AS same_id_number,
+                       COALESCE(b.service_number = a.service_number, FALSE) AS same_service_number,
+                       GREATEST(%(name_score)s,
+                                CASE WHEN b.identification_number = a.identification_number THEN 1.0 ELSE 0.0 END,
+                                CASE WHEN b.service_number = a.service_number THEN 1.0 ELSE 0.0 END) AS score
+                  FROM (%(union)s) b
+                 WHERE (%(name_match)s
+                        OR b.identification_number = a.identification_number
+                        OR b.service_number = a.service_number)
+                   AND (b.model, b.res_id) > (a.model, a.res_id)
+            ) m
+             WHERE m.score >= %(threshold)s
+          ORDER BY m.score DESC, a.model, a.res_id
+             LIMIT %(limit)s
+        """,
+            union=union,
+            name_score=name_score,
+            name_match=name_match,
+            threshold=DUPLICATE_NAME_THRESHOLD,
+            limit=limit,
+        ))
+        return self.env.cr.dictfetchall()
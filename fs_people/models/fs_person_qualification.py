@@ -82,18 +82,21 @@ class FsPersonQualification(models.Model):
             else:
                 record.expiry_status = 'valid'
 
-    @api.onchange('qualification_id', 'issue_date')
-    def _onchange_calculate_expiry(self):
-        """Calculate expiry date based on issue date and validity months.
-        
+    @api.model
+    def _get_expiry_date(self, qualification_type, issue_date):
+        """Expiry for a qualification issued on ``issue_date``, or False if it does not expire.
+
         The expiry date is set to the last day of the month after adding
         the validity period.
         """
+        if not issue_date or not qualification_type.validity_months:
+            return False
+        # Add validity months then go to last day of that month
+        return issue_date + relativedelta(months=qualification_type.validity_months, day=31)
+
+    @api.onchange('qualification_id', 'issue_date')
+    def _onchange_calculate_expiry(self):
+        """Calculate expiry date based on issue date and validity months."""
         for record in self:
             if record.issue_date and record.qualification_id and record.qualification_id.validity_months:  # type: ignore
-                # Add validity months then go to last day of that month
-                expiry_month = record.issue_date + relativedelta(
-                    months=record.qualification_id.validity_months  # type: ignore
-                )
-                # Go to first day of next month, then subtract one day to get last day
-                record.expiry_date = expiry_month + relativedelta(day=31)
+                record.expiry_date = self._get_expiry_date(record.qualification_id, record.issue_date)
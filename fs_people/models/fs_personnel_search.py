@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# Part of Flight School Management System
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+from odoo import api, models
+from odoo.tools import SQL
+
+
+class FsPersonnelSearch(models.AbstractModel):
+    """Single search entry point over all personnel tables.
+
+    Answers "who is callsign X / service number Y" with one UNION ALL query
+    over the trigram-indexed identity columns instead of one ``ilike`` scan
+    per personnel menu.
+    """
+
+    _name = 'fs.personnel.search'
+    _description = 'Personnel Search'
+
+    # Personnel models searched, with whether they carry a callsign column
+    _personnel_search_models = {
+        'fs.student': False,
+        'fs.instructor': True,
+        'fs.pilot': True,
+        'fs.admin.staff': False,
+    }
+
+    @api.model
+    def _get_personnel_search_branches(self, pattern):
+        """Return the UNION ALL branches matching ``pattern`` (an ILIKE pattern).
+
+        Every branch selects (model, res_id, name, callsign, service_number,
+        identification_number) among the records the user may read, record
+        rules included. Override to search additional identity sources.
+        """
+        branches = []
+        for model_name, has_callsign in self._personnel_search_models.items():
+            Model = self.env[model_name]
+            if not Model.has_access('read'):
+                continue
+            Model.flush_model()
+            # _search applies the record rules and active_test in the query itself
+            query = Model._search([])
+            alias = query.table
+            callsign = SQL.identifier(alias, 'callsign') if has_callsign else SQL('NULL::varchar')
+            query.add_where(SQL(
+                """(%(name)s ILIKE %(pattern)s
+                    OR %(service_number)s ILIKE %(pattern)s
+                    OR %(identification_number)s ILIKE %(pattern)s
+                    OR %(callsign)s ILIKE %(pattern)s)""",
+                name=SQL.identifier(alias, 'name'),
+                service_number=SQL.identifier(alias, 'service_number'),
+                identification_number=SQL.identifier(alias, 'identification_number'),
+                callsign=callsign,
+                pattern=pattern,
+            ))
+            branches.append(query.select(
+                SQL("%s AS model", model_name),
+                SQL("%s AS res_id", SQL.identifier(alias, 'id')),
+                SQL.identifier(alias, 'name'),
+                SQL("%s AS callsign", callsign),
+                SQL.identifier(alias, 'service_number'),
+                SQL.identifier(alias, 'identification_number'),
+            ))
+        return branches
+
+    @api.model
+    def search_personnel(self, query, limit=20):
+        """Search students, instructors, pilots and admin staff at once.
+
+        Exact callsign / service number / ID number matches rank first, then
+        prefix matches, then substring matches.
+
+        Returns:
+            list of dicts with keys model, type, id, name, callsign,
+            service_number, identification_number and image_url.
+        """
+        query = (query or '').strip()
+        if not query:
+            return []
+        pattern = '%' + query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        branches = self._get_personnel_search_branches(pattern)
+        if not branches:
+            return []
+        prefix = pattern[1:]
+        self.env.cr.execute(SQL("""
+            SELECT * FROM (
+                SELECT DISTINCT ON (model, res_id) *
+                  FROM (
+                    SELECT u.*,
+                           CASE WHEN lower(u.callsign) = lower(%(query)s)
+                                     OR lower(u.service_number) = lower(%(query)s)
+                                     OR lower(u.identification_number) = lower(%(query)s) THEN 0
+                                WHEN u.name ILIKE %(prefix)s OR u.callsign ILIKE %(prefix)s THEN 1
+                                ELSE 2
+                           END AS relevance
+                      FROM (%(union)s) u
+                  ) ranked
+              ORDER BY model, res_id, relevance
+            ) matches
+          ORDER BY relevance, name
+             LIMIT %(limit)s
+        """, query=query, prefix=prefix, union=SQL(' UNION ALL ').join(branches), limit=limit))
+        rows = self.env.cr.dictfetchall()
+
+        results = []
+        for row in rows:
+            Model = self.env[row['model']]
+            results.append({
+                'model': row['model'],
+                'type': Model._description,
+                'id': row['res_id'],
+                'name': row['name'],
+                'callsign': row['callsign'] or False,
+                'service_number': row['service_number'] or False,
+                'identification_number': row['identification_number'] or False,
+                'image_url': f"/web/image/{row['model']}/{row['res_id']}/image_128"
+                             if 'image_128' in Model._fields else False,
+            })
+        return results
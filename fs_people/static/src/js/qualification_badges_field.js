@@ -0,0 +1,36 @@
+/** @odoo-module **/
+
+import { Component } from "@odoo/owl";
+import { registry } from "@web/core/registry";
+import { standardFieldProps } from "@web/views/fields/standard_field_props";
+
+const STATUS_CLASSES = {
+    valid: "text-bg-success",
+    expiring: "text-bg-warning",
+    expired: "text-bg-danger",
+    no_expiry: "text-bg-secondary",
+};
+
+/**
+ * Renders qualification badges from the compact [[code, status], ...] payload
+ * computed on instructors and pilots.
+ */
+export class QualificationBadgesField extends Component {
+    static template = "fs_people.QualificationBadgesField";
+    static props = { ...standardFieldProps };
+
+    get badges() {
+        return this.props.record.data[this.props.name] || [];
+    }
+
+    badgeClass(status) {
+        return STATUS_CLASSES[status] || STATUS_CLASSES.no_expiry;
+    }
+}
+
+export const qualificationBadgesField = {
+    component: QualificationBadgesField,
+    supportedTypes: ["json"],
+};
+
+registry.category("fields").add("fs_qualification_badges", qualificationBadgesField);
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+# Part of Flight School Management System
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+from . import fs_person_import_wizard
+from . import fs_person_duplicate_report
+from . import fs_qualification_renewal_wizard
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# Part of Flight School Management System
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+from odoo import api, fields, models
+
+from ..models.fs_person_duplicate import DUPLICATE_MODELS
+
+
+class FsPersonDuplicateReport(models.TransientModel):
+    """Batch cleanup report listing personnel records that look like the same person."""
+
+    _name = 'fs.person.duplicate.report'
+    _description = 'Personnel Duplicate Report'
+
+    line_ids = fields.One2many(
+        comodel_name='fs.person.duplicate.report.line',
+        inverse_name='report_id',
+        string='Duplicate Pairs',
+        readonly=True,
+    )
+    pair_count = fields.Integer(
+        string='Pairs Found',
+        readonly=True,
+    )
+
+    def action_find_duplicates(self):
+        """Scan all personnel tables and list the duplicate pairs."""
+        self.ensure_one()
+        pairs = self.env['fs.person.duplicate.mixin']._find_duplicate_pairs()
+        self.line_ids = [(5, 0, 0)] + [(0, 0, {
+            'record_a': f"{pair['model_a']},{pair['res_id_a']}",
+            'record_b': f"{pair['model_b']},{pair['res_id_b']}",
+            'score': pair['score'],
+            'same_id_number': pair['same_id_number'],
+            'same_service_number': pair['same_service_number'],
+        }) for pair in pairs]
+        self.pair_count = len(pairs)
+        return {
+            'type': 'ir.actions.act_window',
+            'res_model': self._name,
+            'res_id': self.id,
+            'view_mode': 'form',
+            'target': 'current',
+        }
+
+
+class FsPersonDuplicateReportLine(models.TransientModel):
+    _name = 'fs.person.duplicate.report.line'
+    _description = 'Personnel Duplicate Pair'
+    _order = 'score desc, id'
+
+    report_id = fields.Many2one('fs.person.duplicate.report', ondelete='cascade')
+    record_a = fields.Reference(
+        selection='_selection_person_models',
+        string='Record',
+    )
+    record_b = fields.Reference(
+        selection='_selection_person_models',
+        string='Possible Duplicate',
+    )
+    score = fields.Float(string='Similarity')
+    same_id_number = fields.Boolean(string='Same ID Number')
+    same_service_number = fields.Boolean(string='Same Service Number')
+
+    @api.model
+    def _selection_person_models(self):
+        return [(model, self.env[model]._description) for model in DUPLICATE_MODELS]
+
+    def _open_record(self, record):
+        return {
+            'type': 'ir.actions.act_window',
+            'res_model': record._name,
+            'res_id': record.id,
+            'view_mode': 'form',
+            'target': 'current',
+        }
+
+    def action_open_record_a(self):
+        self.ensure_one()
+        return self._open_record(self.record_a)
+
+    def action_open_record_b(self):
+        self.ensure_one()
+        return self._open_record(self.record_b)
@@ -0,0 +1,343 @@
+# -*- coding: utf-8 -*-
+# Part of Flight School Management System
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+import csv
+import io
+import os
+from collections import defaultdict
+from itertools import islice
+
+from odoo import fields, models
+from odoo.exceptions import UserError
+
+try:
+    from openpyxl import load_workbook
+except ImportError:
+    load_workbook = None
+
+# Rows handled per lookup / create batch
+IMPORT_CHUNK_SIZE = 500
+
+
+class FsPersonImportWizard(models.TransientModel):
+    """Bulk import of students, instructors and pilots from CSV/XLSX.
+
+    Rows are streamed in chunks. Each chunk resolves existing persons by
+    service number or ID number with a single search and merges rows
+    describing the same person. New persons are created in one batch and
+    matched ones updated per set of columns with a single flush; a failing
+    batch is retried row by row so that failing rows are reported
+    individually without aborting the import.
+    """
+
+    _name = 'fs.person.import.wizard'
+    _description = 'Personnel Import Wizard'
+
+    person_model = fields.Selection(
+        selection=[
+            ('fs.student', 'Students'),
+            ('fs.instructor', 'Instructors'),
+            ('fs.pilot', 'Pilots'),
+        ],
+        string='Import As',
+        required=True,
+        default='fs.student',
+    )
+    file = fields.Binary(
+        string='File',
+        attachment=True,
+        help="CSV (comma or semicolon separated) or XLSX with a header row.",
+    )
+    filename = fields.Char(
+        string='Filename',
+    )
+    update_existing = fields.Boolean(
+        string='Update Existing',
+        default=True,
+        help="Update persons matched by service number or ID number. "
+             "If unchecked, matched rows are skipped.",
+    )
+    state = fields.Selection(
+        selection=[
+            ('upload', 'Upload'),
+            ('done', 'Done'),
+        ],
+        default='upload',
+        required=True,
+    )
+    created_count = fields.Integer(string='Created', readonly=True)
+    updated_count = fields.Integer(string='Updated', readonly=True)
+    skipped_count = fields.Integer(string='Skipped', readonly=True)
+    error_count = fields.Integer(string='Errors', readonly=True)
+    error_ids = fields.One2many(
+        comodel_name='fs.person.import.wizard.error',
+        inverse_name='wizard_id',
+        string='Row Errors',
+        readonly=True,
+    )
+
+    # === Reading ===
+
+    def _open_upload_file(self):
+        """Binary file object of the upload, read from the filestore when possible."""
+        attachment = self.env['ir.attachment'].sudo().search([
+            ('res_model', '=', self._name),
+            ('res_field', '=', 'file'),
+            ('res_id', '=', self.id),
+        ], limit=1)
+        if attachment.store_fname:
+            return open(attachment._full_path(attachment.store_fname), 'rb')
+        return io.BytesIO(attachment.raw or b'')
+
+    def _iter_rows(self):
+        """Yield (row_number, {header: value}) from the uploaded file."""
+        ext = os.path.splitext((self.filename or '').lower())[1]
+        with self._open_upload_file() as upload:
+            yield from self._iter_file_rows(upload, ext)
+
+    def _iter_file_rows(self, upload, ext):
+        """Yield (row_number, {header: value}) from an open binary file."""
+        if ext == '.xlsx':
+            if load_workbook is None:
+                raise UserError("XLSX import requires the openpyxl Python library.")
+            sheet = load_workbook(upload, read_only=True, data_only=True).active
+            rows = sheet.iter_rows(values_only=True)
+        else:
+            text = io.TextIOWrapper(upload, encoding='utf-8-sig', newline='')
+            sample = text.read(4096)
+            text.seek(0)
+            try:
+                dialect = csv.Sniffer().sniff(sample, delimiters=',;\t') if sample else csv.excel
+            except csv.Error:
+                # Single column or ambiguous sample: assume a plain CSV
+                dialect = csv.excel
+            rows = csv.reader(text, dialect)
+
+        header = next(rows, None)
+        if not header:
+            raise UserError("The file is empty.")
+        header = [str(col or '').strip().lower() for col in header]
+        for row_number, row in enumerate(rows, start=2):
+            if not any(cell not in (None, '') for cell in row):
+                continue
+            yield row_number, {
+                col: value.strip() if isinstance(value, str) else value
+                for col, value in zip(header, row) if col
+            }
+
+    # === Conversion ===
+
+    def _get_importable_fields(self):
+        """Simple stored fields of the target model that can be set from a column."""
+        Model = self.env[self.person_model]
+        allowed_types = ('char', 'text', 'date', 'boolean', 'selection', 'integer', 'float', 'monetary')
+        return {
+            name: field for name, field in Model._fields.items()
+            if field.type in allowed_types and field.store and not field.compute
+            and not field.related and not name.startswith(('_', 'message_', 'activity_'))
+            and name not in ('id', 'active', 'display_name')
+        }
+
+    def _get_reference_maps(self):
+        """Lookup tables for many2one columns, keyed by lowercase code and name."""
+        maps = {}
+        for column, model in (('rank', 'fs.rank'), ('department', 'fs.department')):
+            if f'{column}_id' not in self.env[self.person_model]._fields:
+                continue
+            lookup = {}
+            for record in self.env[model].search([]):
+                for key in (record.code, record.name):  # type: ignore
+                    if key:
+                        lookup[key.lower()] = record.id
+            maps[column] = lookup
+        return maps
+
+    def _convert_row(self, row, importable, references):
+        """Convert a raw row to write values. Raises ValueError on bad data."""
+        vals = {}
+        for column, value in row.items():
+            if value in (None, ''):
+                continue
+            if column in references:
+                ref_id = references[column].get(str(value).lower())
+                if not ref_id:
+                    raise ValueError(f"Unknown {column} '{value}'.")
+                vals[f'{column}_id'] = ref_id
+                continue
+            field = importable.get(column)
+            if not field:
+                continue
+            if field.type == 'date':
+                vals[column] = value if hasattr(value, 'year') else fields.Date.to_date(str(value))
+            elif field.type == 'boolean':
+                vals[column] = str(value).lower() in ('1', 'true', 'yes', 'y', 'x')
+            elif field.type == 'selection':
+                keys = {str(key).lower(): key for key, __ in field._description_selection(self.env)}
+                if str(value).lower() not in keys:
+                    raise ValueError(f"Invalid value '{value}' for {field.string}.")
+                vals[column] = keys[str(value).lower()]
+            elif field.type in ('integer',):
+                vals[column] = int(value)
+            elif field.type in ('float', 'monetary'):
+                vals[column] = float(value)
+            else:
+                vals[column] = str(value)
+        return vals
+
+    # === Import ===
+
+    def action_import(self):
+        """Stream the file and import it chunk by chunk."""
+        self.ensure_one()
+        if not self.with_context(bin_size=True).file:
+            raise UserError("Please upload a file.")
+
+        importable = self._get_importable_fields()
+        references = self._get_reference_maps()
+        totals = {'created': 0, 'updated': 0, 'skipped': 0}
+        errors = []
+        rows = self._iter_rows()
+        while True:
+            chunk = list(islice(rows, IMPORT_CHUNK_SIZE))
+            if not chunk:
+                break
+            self._import_chunk(chunk, importable, references, totals, errors)
+
+        self.write({
+            'state': 'done',
+            'created_count': totals['created'],
+            'updated_count': totals['updated'],
+            'skipped_count': totals['skipped'],
+            'error_count': len(errors),
+            'error_ids': [(0, 0, {'row_number': number, 'message': message}) for number, message in errors],
+        })
+        return {
+            'type': 'ir.actions.act_window',
+            'res_model': self._name,
+            'res_id': self.id,
+            'view_mode': 'form',
+            'target': 'new',
+        }
+
+    def _import_chunk(self, chunk, importable, references, totals, errors):
+        """Match, create and update one chunk of rows."""
+        Model = self.env[self.person_model].with_context(active_test=False, tracking_disable=True)
+
+        converted = []
+        for row_number, row in chunk:
+            try:
+                vals = self._convert_row(row, importable, references)
+            except (ValueError, TypeError) as exc:
+                errors.append((row_number, str(exc)))
+                continue
+            converted.append((row_number, vals))
+
+        # One lookup for the whole chunk
+        service_numbers = {vals['service_number'] for __, vals in converted if vals.get('service_number')}
+        id_numbers = {vals['identification_number'] for __, vals in converted if vals.get('identification_number')}
+        by_service, by_id_number = {}, {}
+        if service_numbers or id_numbers:
+            for person in Model.search(['|',
+                                        ('service_number', 'in', list(service_numbers)),
+                                        ('identification_number', 'in', list(id_numbers))]):
+                if person.service_number:
+                    by_service.setdefault(person.service_number, person)
+                if person.identification_number:
+                    by_id_number.setdefault(person.identification_number, person)
+
+        # Rows sharing a service or ID number describe the same person:
+        # merge them, later rows overriding earlier ones
+        groups, group_by_key = [], {}
+        for row_number, vals in converted:
+            keys = [key for key in (('service', vals.get('service_number')),
+                                    ('id', vals.get('identification_number'))) if key[1]]
+            group = next((group_by_key[key] for key in keys if key in group_by_key), None)
+            if group is None:
+                existing = (by_service.get(vals.get('service_number'))
+                            or by_id_number.get(vals.get('identification_number')))
+                group = group_by_key.get(('person', existing.id)) if existing else None
+                if group is None:
+                    group = {'person': existing or Model, 'rows': [], 'vals': {}}
+                    groups.append(group)
+                    if existing:
+                        group_by_key[('person', existing.id)] = group
+            elif not self.update_existing:
+                totals['skipped'] += 1
+                continue
+            group['rows'].append(row_number)
+            group['vals'].update(vals)
+            for key in keys:
+                group_by_key.setdefault(key, group)
+
+        to_create, to_update = [], defaultdict(list)
+        for group in groups:
+            person, row_numbers, vals = group['person'], group['rows'], group['vals']
+            if not person:
+                if not vals.get('name') or not vals.get('gender'):
+                    errors.extend((number, "Columns 'name' and 'gender' are required for new persons.")
+                                  for number in row_numbers)
+                    continue
+                to_create.append((row_numbers, vals))
+            elif not self.update_existing:
+                totals['skipped'] += len(row_numbers)
+            else:
+                to_update[tuple(sorted(vals))].append((row_numbers, (person, vals)))
+
+        # Rows setting the same columns are written together and flushed at
+        # once, which the ORM turns into one UPDATE per column set
+        for items in to_update.values():
+            updated = self._apply_in_batch(items, self._write_rows, errors)
+            totals['updated'] += sum(len(row_numbers) for row_numbers, __ in updated)
+        created = self._apply_in_batch(to_create, Model.create, errors)
+        totals['created'] += len(created)
+        # Rows merged into a person created from an earlier row updated it
+        totals['updated'] += sum(len(row_numbers) - 1 for row_numbers, __ in created)
+
+    @staticmethod
+    def _write_rows(updates):
+        """Write each (person, vals) pair; the caller flushes them together."""
+        for person, vals in updates:
+            person.write(vals)
+
+    def _apply_in_batch(self, items, apply, errors):
+        """Call ``apply`` on all payloads at once, or one by one if that fails.
+
+        Args:
+            items: list of (row_numbers, payload).
+            apply: callable taking a list of payloads.
+            errors: list receiving (row_number, message) of failing rows.
+
+        Returns:
+            The items that were applied.
+        """
+        if not items:
+            return []
+        Model = self.env[self.person_model]
+        try:
+            with self.env.cr.savepoint():
+                apply([payload for __, payload in items])
+                Model.flush_model()
+            return items
+        except Exception:  # noqa: BLE001 - retried per row below
+            pass
+        applied = []
+        for row_numbers, payload in items:
+            try:
+                with self.env.cr.savepoint():
+                    apply([payload])
+                    Model.flush_model()
+                applied.append((row_numbers, payload))
+            except Exception as exc:  # noqa: BLE001 - reported per row
+                errors.extend((number, str(exc)) for number in row_numbers)
+        return applied
+
+
+class FsPersonImportWizardError(models.TransientModel):
+    _name = 'fs.person.import.wizard.error'
+    _description = 'Personnel Import Row Error'
+    _order = 'row_number'
+
+    wizard_id = fields.Many2one('fs.person.import.wizard', ondelete='cascade')
+    row_number = fields.Integer(string='Row')
+    message = fields.Char(string='Error')
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+# Part of Flight School Management System
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+from odoo import api, fields, models
+from odoo.exceptions import UserError
+
+
+class FsQualificationRenewalWizard(models.TransientModel):
+    """Renew one qualification type for many instructors or pilots at once.
+
+    Existing rows of that type are updated with a single write and missing
+    ones are created with a single create, so the parent expiry aggregates
+    are recomputed once per person.
+    """
+
+    _name = 'fs.qualification.renewal.wizard'
+    _description = 'Qualification Renewal Wizard'
+
+    person_type = fields.Selection(
+        selection=[
+            ('instructor', 'Instructors'),
+            ('pilot', 'Pilots'),
+        ],
+        string='Renew For',
+        required=True,
+        default='instructor',
+    )
+    qualification_id = fields.Many2one(
+        comodel_name='fs.qualification.type',
+        string='Qualification',
+        required=True,
+    )
+    issue_date = fields.Date(
+        string='Issue Date',
+        required=True,
+        default=fields.Date.context_today,
+    )
+    expiry_date = fields.Date(
+        string='Expiry Date',
+        compute='_compute_expiry_date',
+        help="Computed from the qualification validity. Empty if it does not expire.",
+    )
+    instructor_ids = fields.Many2many(
+        comodel_name='fs.instructor',
+        string='Instructors',
+    )
+    pilot_ids = fields.Many2many(
+        comodel_name='fs.pilot',
+        string='Pilots',
+    )
+
+    @api.model
+    def default_get(self, fields_list):
+        res = super().default_get(fields_list)
+        active_model = self.env.context.get('active_model')
+        active_ids = self.env.context.get('active_ids') or []
+        if active_model == 'fs.instructor':
+            res.update(person_type='instructor', instructor_ids=[(6, 0, active_ids)])
+        elif active_model == 'fs.pilot':
+            res.update(person_type='pilot', pilot_ids=[(6, 0, active_ids)])
+        return res
+
+    @api.depends('qualification_id', 'issue_date')
+    def _compute_expiry_date(self):
+        Qualification = self.env['fs.person.qualification']
+        for wizard in self:
+            wizard.expiry_date = Qualification._get_expiry_date(wizard.qualification_id, wizard.issue_date)
+
+    def action_renew(self):
+        self.ensure_one()
+        person_field = f'{self.person_type}_id'
+        persons = self.instructor_ids if self.person_type == 'instructor' else self.pilot_ids
+        if not persons:
+            raise UserError("Please select at least one person.")
+
+        vals = {'issue_date': self.issue_date, 'expiry_date': self.expiry_date}
+        Qualification = self.env['fs.person.qualification']
+        existing = Qualification.search([
+            (person_field, 'in', persons.ids),
+            ('qualification_id', '=', self.qualification_id.id),
+        ])
+        existing.write(vals)
+        missing = persons - existing[person_field]
+        Qualification.create([
+            dict(vals, qualification_id=self.qualification_id.id, **{person_field: person.id})
+            for person in missing
+        ])
+
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': 'Qualification Renewal',
+                'message': f"{self.qualification_id.name} renewed for {len(persons)} person(s) "
+                           f"({len(existing)} updated, {len(missing)} added).",
+                'type': 'success',
+                'next': {'type': 'ir.actions.act_window_close'},
+            },
+        }
@@ -19,6 +19,7 @@ Key Features:
 * Batch scheduling wizard for tomorrow's missions.
 * Instructor and aircraft availability management.
 * Automatic eligibility checks (expiries, qualifications).
+* Instructor recent-experience currency from completed flights.
 * Configurable buffer times and scheduling sequences.
     """,
     'author': 'Ghazi Marzouk',
@@ -31,12 +32,15 @@ Key Features:
     'data': [
         'security/ir.model.access.csv',
         'data/fs_scheduling_data.xml',
+        'data/fs_scheduling_cron.xml',
         'wizard/fs_scheduling_wizard_views.xml',
         'views/fs_cancellation_reason_views.xml',
         'views/fs_custom_flight_type_views.xml',
         'views/fs_scheduled_flight_views.xml',
+        'views/fs_instructor_views.xml',
         'views/res_config_settings_views.xml',
         'views/fs_scheduling_menus.xml',
+        'wizard/fs_mission_duration_wizard_views.xml',
     ],
     'installable': True,
     'application': True,
@@ -6,3 +6,7 @@ from . import res_config_settings
 from . import fs_cancellation_reason
 from . import fs_custom_flight_type
 from . import fs_scheduled_flight
+from . import fs_student_enrollment
+from . import fs_flight_mission
+from . import fs_instructor_currency
+from . import fs_scheduling_eligibility
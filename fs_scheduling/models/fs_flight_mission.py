@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+# Part of Flight School Management System
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+import math
+from collections import defaultdict
+
+from odoo import api, models
+from odoo.tools import SQL
+
+# Completed flights required before a mission duration estimate is trusted
+MIN_DURATION_SAMPLES = 5
+
+
+class FsFlightMission(models.Model):
+    """Re-estimate syllabus mission durations from completed flights."""
+
+    _inherit = 'fs.flight.mission'  # type: ignore
+
+    @api.model
+    def _get_duration_statistics(self, min_samples=MIN_DURATION_SAMPLES):
+        """Aggregate actual durations of completed flights in a single query.
+
+        Returns one row per (mission, discipline) and one per
+        (mission, discipline, aircraft type), with sample count, median and P80.
+        Mission-level rows have ``aircraft_type_id`` set to None.
+        """
+        self.env['fs.scheduled.flight'].flush_model(
+            ['mission_id', 'discipline_id', 'aircraft_id', 'status', 'actual_duration'])
+        self.env['fs.aircraft'].flush_model(['aircraft_type_id'])
+        self.env.cr.execute(SQL("""
+            SELECT f.mission_id, f.discipline_id, a.aircraft_type_id,
+                   COUNT(*) AS sample_count,
+                   percentile_cont(0.5) WITHIN GROUP (ORDER BY f.actual_duration) AS median,
+                   percentile_cont(0.8) WITHIN GROUP (ORDER BY f.actual_duration) AS p80
+              FROM fs_scheduled_flight f
+              JOIN fs_aircraft a ON a.id = f.aircraft_id
+             WHERE f.status = 'completed'
+               AND f.mission_id IS NOT NULL
+               AND f.actual_duration > 0
+          GROUP BY GROUPING SETS (
+                   (f.mission_id, f.discipline_id),
+                   (f.mission_id, f.discipline_id, a.aircraft_type_id))
+            HAVING COUNT(*) >= %s
+          ORDER BY f.mission_id, a.aircraft_type_id NULLS FIRST
+        """, min_samples))
+        return self.env.cr.dictfetchall()
+
+    @api.model
+    def _round_duration_to_slot(self, hours):
+        """Round a duration up to the configured scheduling time slot."""
+        slot = int(self.env['ir.config_parameter'].sudo().get_param(  # type: ignore
+            'flight_school.scheduling_time_slot_minutes', '15')) or 15
+        return math.ceil(round(hours * 60.0, 6) / slot) * slot / 60.0
+
+    @api.model
+    def _apply_duration_estimates(self, durations):
+        """Write new durations for many missions, one write per distinct duration.
+
+        Durations are rounded to scheduling slots, so only a handful of
+        distinct values exist and the update stays set-based.
+
+        Args:
+            durations: dict {mission_id: duration_hours}
+        """
+        missions = self.browse(durations)
+        by_duration = defaultdict(list)
+        for mission in missions:
+            if mission.duration_hours != durations[mission.id]:
+                by_duration[durations[mission.id]].append(mission.id)
+        for hours, mission_ids in by_duration.items():
+            self.browse(mission_ids).write({'duration_hours': hours})
+
+    @api.model
+    def _cron_update_durations(self):
+        """Apply median-based durations when automatic re-estimation is enabled."""
+        auto_update = self.env['ir.config_parameter'].sudo().get_param(  # type: ignore
+            'flight_school.mission_duration_auto_update')
+        if not auto_update:
+            return
+        self._apply_duration_estimates({
+            row['mission_id']: self._round_duration_to_slot(row['median'])
+            for row in self._get_duration_statistics()
+            if not row['aircraft_type_id']
+        })
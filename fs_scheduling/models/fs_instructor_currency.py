@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+# Part of Flight School Management System
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+from odoo import api, fields, models
+from odoo.tools import SQL
+
+
+class FsInstructorCurrencyBucket(models.Model):
+    """Completed flights per instructor and day.
+
+    A compact rollup of completed flights (as first or second instructor)
+    from which the recency window is evaluated, instead of re-summing the
+    flight history for every candidate.
+    """
+
+    _name = 'fs.instructor.currency.bucket'
+    _description = 'Instructor Currency Daily Bucket'
+    _order = 'date desc'
+    _log_access = False
+
+    instructor_id = fields.Many2one(
+        comodel_name='fs.instructor',
+        string='Instructor',
+        required=True,
+        ondelete='cascade',
+    )
+    date = fields.Date(
+        string='Date',
+        required=True,
+    )
+    flight_count = fields.Integer(
+        string='Flights',
+    )
+    flight_hours = fields.Float(
+        string='Hours',
+    )
+
+    _instructor_date_unique = models.Constraint(
+        'UNIQUE(instructor_id, date)',
+        'Only one currency bucket per instructor and day!',
+    )
+
+    @api.model
+    def _get_bucket_source_sql(self):
+        """Completed flights, one row per crew seat held by an instructor."""
+        return SQL("""
+            SELECT crew.instructor_id, f.date,
+                   COALESCE(NULLIF(f.actual_duration, 0), f.duration, 0) AS hours
+              FROM fs_scheduled_flight f
+        CROSS JOIN LATERAL (VALUES (f.instructor_id), (f.instructor2_id)) AS crew(instructor_id)
+             WHERE f.status = 'completed'
+               AND crew.instructor_id IS NOT NULL
+               AND f.date IS NOT NULL
+        """)
+
+    @api.model
+    def _refresh_buckets(self, keys):
+        """Recompute the buckets of the given (instructor_id, date) pairs."""
+        keys = {(instructor_id, date) for instructor_id, date in keys if instructor_id and date}
+        if not keys:
+            return
+        self.env['fs.scheduled.flight'].flush_model(
+            ['status', 'date', 'instructor_id', 'instructor2_id', 'actual_duration', 'duration'])
+        values = SQL(', ').join(SQL('(%s, %s::date)', instructor_id, date) for instructor_id, date in keys)
+        self.env.cr.execute(SQL("""
+            DELETE FROM fs_instructor_currency_bucket b
+             USING (VALUES %(values)s) AS k(instructor_id, date)
+             WHERE b.instructor_id = k.instructor_id AND b.date = k.date;
+
+            INSERT INTO fs_instructor_currency_bucket (instructor_id, date, flight_count, flight_hours)
+            SELECT s.instructor_id, s.date, COUNT(*), SUM(s.hours)
+              FROM (%(source)s) s
+              JOIN (VALUES %(values)s) AS k(instructor_id, date)
+                ON k.instructor_id = s.instructor_id AND k.date = s.date
+          GROUP BY s.instructor_id, s.date;
+        """, values=values, source=self._get_bucket_source_sql()))
+        self.invalidate_model()
+        self.env['fs.instructor'].browse({instructor_id for instructor_id, __ in keys})._update_currency()
+
+    @api.model
+    def _rebuild_buckets(self):
+        """Rebuild every bucket from the flight history."""
+        self.env['fs.scheduled.flight'].flush_model()
+        self.env.cr.execute(SQL("""
+            DELETE FROM fs_instructor_currency_bucket;
+            INSERT INTO fs_instructor_currency_bucket (instructor_id, date, flight_count, flight_hours)
+            SELECT s.instructor_id, s.date, COUNT(*), SUM(s.hours)
+              FROM (%s) s
+          GROUP BY s.instructor_id, s.date;
+        """, self._get_bucket_source_sql()))
+        self.invalidate_model()
+        self.env['fs.instructor']._update_currency()
+
+
+class FsInstructor(models.Model):
+    """Recent-experience currency derived from the daily buckets."""
+
+    _inherit = 'fs.instructor'  # type: ignore
+
+    is_current = fields.Boolean(
+        string='Current',
+        readonly=True,
+        help="Meets the recent-experience requirement (flights and hours within the "
+             "currency window) as of today.",
+    )
+    currency_expiry_date = fields.Date(
+        string='Currency Expiry',
+        readonly=True,
+        help="Last day the recent-experience requirement is met without further flights.",
+    )
+
+    @api.model
+    def _get_currency_requirements(self):
+        """Return (window days, minimum flights, minimum hours) from settings."""
+        get_param = self.env['ir.config_parameter'].sudo().get_param
+        return (
+            int(get_param('flight_school.currency_window_days', '90')) or 90,  # type: ignore
+            int(get_param('flight_school.currency_min_flights', '3')),  # type: ignore
+            float(get_param('flight_school.currency_min_hours', '0')),  # type: ignore
+        )
+
+    def _update_currency(self):
+        """Recompute currency for ``self`` (all instructors if empty) in one UPDATE.
+
+        Walking each instructor's buckets from the newest day backwards, the
+        requirement is met from the first day on which the running totals reach
+        the minimums; the instructor stays current for the window from that day.
+        """
+        window, min_flights, min_hours = self._get_currency_requirements()
+        self.env['fs.instructor.currency.bucket'].flush_model()
+        self.flush_model(['is_current', 'currency_expiry_date'])
+        self.env.cr.execute(SQL("""
+            WITH running AS (
+                SELECT instructor_id, date,
+                       SUM(flight_count) OVER w AS flights,
+                       SUM(flight_hours) OVER w AS hours
+                  FROM fs_instructor_currency_bucket
+                 WHERE %(bucket_filter)s
+                WINDOW w AS (PARTITION BY instructor_id ORDER BY date DESC)
+            ), reached AS (
+                SELECT instructor_id,
+                       -- LEAST() ignores NULLs: both minimums must have been reached
+                       CASE WHEN MAX(date) FILTER (WHERE flights >= %(min_flights)s) IS NULL
+                              OR MAX(date) FILTER (WHERE hours >= %(min_hours)s) IS NULL
+                            THEN NULL
+                            ELSE LEAST(MAX(date) FILTER (WHERE flights >= %(min_flights)s),
+                                       MAX(date) FILTER (WHERE hours >= %(min_hours)s)) + %(window)s - 1
+                       END AS expiry
+                  FROM running
+              GROUP BY instructor_id
+            )
+            UPDATE fs_instructor i
+               SET currency_expiry_date = r.expiry,
+                   is_current = COALESCE(r.expiry >= %(today)s, FALSE)
+              FROM fs_instructor t
+         LEFT JOIN reached r ON r.instructor_id = t.id
+             WHERE i.id = t.id
+               AND %(instructor_filter)s
+               AND (i.currency_expiry_date IS DISTINCT FROM r.expiry
+                    OR i.is_current IS DISTINCT FROM COALESCE(r.expiry >= %(today)s, FALSE))
+         RETURNING i.id
+        """,
+            bucket_filter=SQL('instructor_id = ANY(%s)', self.ids) if self else SQL('TRUE'),
+            instructor_filter=SQL('t.id = ANY(%s)', self.ids) if self else SQL('TRUE'),
+            min_flights=min_flights,
+            min_hours=min_hours,
+            window=window,
+            today=fields.Date.context_today(self),
+        ))
+        changed = self.browse(row[0] for row in self.env.cr.fetchall())
+        self.invalidate_model(['is_current', 'currency_expiry_date'])
+        self.env['fs.scheduling.eligibility']._refresh_resources(instructors=changed)
+
+    @api.model
+    def _cron_update_currency(self):
+        """Daily: roll the currency window forward."""
+        self._update_currency()
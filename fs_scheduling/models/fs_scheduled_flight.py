@@ -7,6 +7,10 @@ from datetime import datetime, timedelta
 from odoo import api, fields, models, _
 from odoo.exceptions import ValidationError, UserError
 
+# Fields feeding the instructor currency buckets
+CURRENCY_FIELDS = {'status', 'date', 'instructor_id', 'instructor2_id', 'duration', 'actual_duration',
+                   'actual_start', 'actual_end'}
+
 
 class FsScheduledFlight(models.Model):
     """Instances of flight missions scheduled for specific resources and times."""
@@ -263,7 +267,31 @@ class FsScheduledFlight(models.Model):
         for vals in vals_list:
             if not vals.get('callsign') or vals.get('callsign') == '/':
                 vals['callsign'] = self._generate_next_callsign(vals.get('date'))
-        return super().create(vals_list)
+        flights = super().create(vals_list)
+        self.env['fs.instructor.currency.bucket']._refresh_buckets(flights._get_currency_keys())
+        return flights
+
+    def write(self, vals):
+        if not CURRENCY_FIELDS.intersection(vals):
+            return super().write(vals)
+        keys = self._get_currency_keys()
+        res = super().write(vals)
+        self.env['fs.instructor.currency.bucket']._refresh_buckets(keys | self._get_currency_keys())
+        return res
+
+    def unlink(self):
+        keys = self._get_currency_keys()
+        res = super().unlink()
+        self.env['fs.instructor.currency.bucket']._refresh_buckets(keys)
+        return res
+
+    def _get_currency_keys(self):
+        """(instructor_id, date) pairs of completed flights, for currency bucket refresh."""
+        return {
+            (instructor.id, flight.date)
+            for flight in self if flight.status == 'completed'
+            for instructor in flight.instructor_id | flight.instructor2_id
+        }
 
     def _generate_next_callsign(self, date=False):
         """Generate next callsign based on prefix and sequence."""
@@ -323,4 +351,16 @@ class FsScheduledFlight(models.Model):
             if a_conflict:
                 conflicts.append(_("Aircraft %s has another flight overlap (with %d min buffer).") % (self.aircraft_id.registration, buffer_min))
 
+        # Eligibility on the flight date, from the daily snapshot
+        Eligibility = self.env['fs.scheduling.eligibility']
+        rows = Eligibility._get_eligibility_rows(self.date)
+        reasons = Eligibility._get_ineligibility_reasons(
+            self.date, students=self.student_id, instructors=self.instructor_id | self.instructor2_id,
+            aircraft=self.aircraft_id, rows=rows)
+        for resource, reason in reasons.items():
+            conflicts.append(_("%s is not eligible on %s: %s.") % (resource.display_name, self.date, reason))
+        if self.is_exam and self.instructor_id \
+                and self.instructor_id.id not in Eligibility._get_eligible_ids(self.date, rows=rows)['examiner']:
+            conflicts.append(_("Instructor %s is not a qualified examiner on %s.") % (self.instructor_id.name, self.date))
+
         return conflicts
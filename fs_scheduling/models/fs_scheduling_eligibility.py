@@ -0,0 +1,411 @@
+# -*- coding: utf-8 -*-
+# Part of Flight School Management System
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+from datetime import timedelta
+
+from odoo import api, fields, models
+from odoo.tools import SQL
+from odoo.tools.sql import create_unique_index
+
+# Fields of each resource model read by the eligibility query
+ELIGIBILITY_FIELDS = {
+    'fs.student': {'active', 'medical_expiry', 'license_expiry', 'insurance_expiry', 'security_clearance_expiry'},
+    'fs.instructor': {'active', 'medical_expiry', 'english_expiry', 'is_current'},
+    'fs.aircraft': {'active', 'status', 'cof_a_expiry', 'arc_expiry', 'insurance_expiry'},
+}
+
+
+class FsSchedulingEligibility(models.Model):
+    """Per-date eligibility of students, instructors and aircraft.
+
+    The snapshot of a date is built in one pass by the nightly cron or the
+    wizard's refresh action, and read by the scheduling wizard and the
+    conflict checker instead of evaluating expiry fields resource by
+    resource. Writes to the source fields refresh the rows of the affected
+    resources in the existing snapshots. Readers never write: when a date
+    has no snapshot, the same query is evaluated on the fly.
+    """
+
+    _name = 'fs.scheduling.eligibility'
+    _description = 'Scheduling Eligibility Snapshot'
+    _order = 'date desc, resource_type'
+    _log_access = False
+
+    date = fields.Date(
+        string='Date',
+        required=True,
+        index=True,
+    )
+    resource_type = fields.Selection(
+        selection=[
+            ('student', 'Student'),
+            ('instructor', 'Instructor'),
+            ('aircraft', 'Aircraft'),
+        ],
+        string='Resource Type',
+        required=True,
+    )
+    student_id = fields.Many2one(
+        comodel_name='fs.student',
+        string='Student',
+        ondelete='cascade',
+    )
+    instructor_id = fields.Many2one(
+        comodel_name='fs.instructor',
+        string='Instructor',
+        ondelete='cascade',
+    )
+    aircraft_id = fields.Many2one(
+        comodel_name='fs.aircraft',
+        string='Aircraft',
+        ondelete='cascade',
+    )
+    is_eligible = fields.Boolean(
+        string='Eligible',
+    )
+    is_examiner = fields.Boolean(
+        string='Examiner',
+        help="Instructor holds a valid examiner qualification on this date.",
+    )
+    reason = fields.Char(
+        string='Reason',
+        help="Failed checks, if not eligible.",
+    )
+    computed_at = fields.Datetime(
+        string='Computed At',
+    )
+
+    def init(self):
+        # One row per resource and date
+        create_unique_index(
+            self.env.cr, 'fs_scheduling_eligibility_resource_uniq', self._table,
+            ['date', 'resource_type', 'COALESCE(student_id, instructor_id, aircraft_id)'],
+        )
+
+    @api.model
+    def _eligibility_query(self, date, resources=None):
+        """SQL selecting the eligibility rows of ``date``.
+
+        Args:
+            resources: optional dict with 'student', 'instructor' and
+                'aircraft' recordsets restricting the rows; all active
+                resources when omitted.
+
+        Columns: resource_type, student_id, instructor_id, aircraft_id,
+        is_eligible, is_examiner, reason.
+        """
+        def resource_filter(alias, resource_type):
+            if resources is None:
+                return SQL("TRUE")
+            return SQL("%s = ANY(%s::int[])", SQL.identifier(alias, 'id'), resources[resource_type].ids)
+
+        Availability = self.env['fs.instructor.availability']
+        available = Availability.available_instructors(
+            *Availability._get_day_window(date),
+            instructors=None if resources is None else resources['instructor'],
+        )
+        check_currency = bool(self.env['ir.config_parameter'].sudo().get_param(
+            'flight_school.currency_check_scheduling'))
+        for model in ('fs.student', 'fs.instructor', 'fs.aircraft', 'fs.person.qualification'):
+            self.env[model].flush_model()
+        return SQL("""
+            SELECT 'student' AS resource_type, s.id AS student_id, NULL::int AS instructor_id,
+                   NULL::int AS aircraft_id, c.reason IS NULL AS is_eligible, FALSE AS is_examiner, c.reason
+              FROM fs_student s
+        CROSS JOIN LATERAL (SELECT NULLIF(concat_ws(', ',
+                       CASE WHEN s.medical_expiry < %(date)s THEN 'Medical expired' END,
+                       CASE WHEN s.license_expiry < %(date)s THEN 'License expired' END,
+                       CASE WHEN s.insurance_expiry < %(date)s THEN 'Insurance expired' END,
+                       CASE WHEN s.security_clearance_expiry < %(date)s THEN 'Security clearance expired' END
+                   ), '') AS reason) c
+             WHERE s.active AND %(student_filter)s
+         UNION ALL
+            SELECT 'instructor', NULL, i.id, NULL, c.reason IS NULL, COALESCE(q.is_examiner, FALSE), c.reason
+              FROM fs_instructor i
+         LEFT JOIN (
+                SELECT pq.instructor_id,
+                       bool_or(pq.expiry_date < %(date)s) AS has_expired,
+                       bool_or(qt.is_examinator AND (pq.expiry_date IS NULL OR pq.expiry_date >= %(date)s)) AS is_examiner
+                  FROM fs_person_qualification pq
+                  JOIN fs_qualification_type qt ON qt.id = pq.qualification_id
+                 WHERE pq.instructor_id IS NOT NULL
+              GROUP BY pq.instructor_id
+            ) q ON q.instructor_id = i.id
+        CROSS JOIN LATERAL (SELECT NULLIF(concat_ws(', ',
+                       CASE WHEN i.medical_expiry < %(date)s THEN 'Medical expired' END,
+                       CASE WHEN i.english_expiry < %(date)s THEN 'English proficiency expired' END,
+                       CASE WHEN q.has_expired THEN 'Qualification expired' END,
+                       CASE WHEN NOT i.id = ANY(%(available)s::int[]) THEN 'Unavailable' END,
+                       CASE WHEN %(check_currency)s AND NOT COALESCE(i.is_current, FALSE) THEN 'Not current' END
+                   ), '') AS reason) c
+             WHERE i.active AND %(instructor_filter)s
+         UNION ALL
+            SELECT 'aircraft', NULL, NULL, a.id, c.reason IS NULL, FALSE, c.reason
+              FROM fs_aircraft a
+        CROSS JOIN LATERAL (SELECT NULLIF(concat_ws(', ',
+                       CASE WHEN NOT COALESCE(a.is_airworthy, FALSE) THEN 'Not airworthy' END,
+                       CASE WHEN a.cof_a_expiry < %(date)s THEN 'C of A expired' END,
+                       CASE WHEN a.arc_expiry < %(date)s THEN 'ARC expired' END,
+                       CASE WHEN a.insurance_expiry < %(date)s THEN 'Insurance expired' END
+                   ), '') AS reason) c
+             WHERE a.active AND %(aircraft_filter)s
+        """,
+            date=date,
+            available=available.ids,
+            check_currency=check_currency,
+            student_filter=resource_filter('s', 'student'),
+            instructor_filter=resource_filter('i', 'instructor'),
+            aircraft_filter=resource_filter('a', 'aircraft'),
+        )
+
+    @api.model
+    def _write_snapshot(self, date, resources=None):
+        """Replace the snapshot rows of ``date``, only those of ``resources`` if given."""
+        if resources is None:
+            delete_filter = SQL("TRUE")
+        else:
+            delete_filter = SQL(
+                "(student_id = ANY(%s::int[]) OR instructor_id = ANY(%s::int[]) OR aircraft_id = ANY(%s::int[]))",
+                resources['student'].ids, resources['instructor'].ids, resources['aircraft'].ids,
+            )
+        self.env.cr.execute(SQL("""
+            DELETE FROM fs_scheduling_eligibility WHERE date = %(date)s AND %(delete_filter)s;
+
+            INSERT INTO fs_scheduling_eligibility
+                   (date, resource_type, student_id, instructor_id, aircraft_id,
+                    is_eligible, is_examiner, reason, computed_at)
+            SELECT %(date)s, e.resource_type, e.student_id, e.instructor_id, e.aircraft_id,
+                   e.is_eligible, e.is_examiner, e.reason, %(now)s
+              FROM (%(query)s) e;
+        """,
+            date=date,
+            delete_filter=delete_filter,
+            now=fields.Datetime.now(),
+            query=self._eligibility_query(date, resources),
+        ))
+        self.invalidate_model()
+
+    @api.model
+    def _build_snapshot(self, date):
+        """(Re)build the whole eligibility snapshot of ``date``.
+
+        Only called from the cron and explicit actions, never while reading.
+        """
+        self._write_snapshot(date)
+
+    @api.model
+    def _refresh_resources(self, students=None, instructors=None, aircraft=None):
+        """Recompute the rows of the given resources in the current and future snapshots.
+
+        Called when a field the eligibility depends on is written, so that
+        snapshots stay valid without rebuilding whole dates.
+        """
+        resources = {
+            'student': students or self.env['fs.student'],
+            'instructor': instructors or self.env['fs.instructor'],
+            'aircraft': aircraft or self.env['fs.aircraft'],
+        }
+        if not any(resources.values()):
+            return
+        self.env.cr.execute(SQL(
+            "SELECT DISTINCT date FROM fs_scheduling_eligibility WHERE date >= %s",
+            fields.Date.context_today(self),
+        ))
+        for date, in self.env.cr.fetchall():
+            self._write_snapshot(date, resources)
+
+    @api.model
+    def _get_eligibility_rows(self, date):
+        """Eligibility rows of ``date``, from the snapshot when there is one.
+
+        Returns a list of (resource_type, student_id, instructor_id,
+        aircraft_id, is_eligible, is_examiner, reason) tuples.
+        """
+        self.env.cr.execute(SQL(
+            "SELECT 1 FROM fs_scheduling_eligibility WHERE date = %s LIMIT 1", date))
+        if self.env.cr.rowcount:
+            query = SQL("""
+                SELECT resource_type, student_id, instructor_id, aircraft_id, is_eligible, is_examiner, reason
+                  FROM fs_scheduling_eligibility
+                 WHERE date = %s
+            """, date)
+        else:
+            query = self._eligibility_query(date)
+        self.env.cr.execute(query)
+        return self.env.cr.fetchall()
+
+    @api.model
+    def _get_eligible_ids(self, date, rows=None):
+        """Eligible resource ids for ``date``.
+
+        Args:
+            rows: rows from ``_get_eligibility_rows``, to avoid reading them again.
+
+        Returns:
+            dict with sets of ids under keys 'student', 'instructor',
+            'examiner' and 'aircraft'.
+        """
+        if rows is None:
+            rows = self._get_eligibility_rows(date)
+        eligible = {'student': set(), 'instructor': set(), 'examiner': set(), 'aircraft': set()}
+        for resource_type, student_id, instructor_id, aircraft_id, is_eligible, is_examiner, __ in rows:
+            if not is_eligible:
+                continue
+            res_id = student_id or instructor_id or aircraft_id
+            eligible[resource_type].add(res_id)
+            if is_examiner:
+                eligible['examiner'].add(res_id)
+        return eligible
+
+    @api.model
+    def _get_ineligibility_reasons(self, date, students=None, instructors=None, aircraft=None, rows=None):
+        """Reasons keyed by record, for the given resources not eligible on ``date``.
+
+        Args:
+            rows: rows from ``_get_eligibility_rows``, to avoid reading them again.
+        """
+        if rows is None:
+            rows = self._get_eligibility_rows(date)
+        wanted = {
+            'student': students or self.env['fs.student'],
+            'instructor': instructors or self.env['fs.instructor'],
+            'aircraft': aircraft or self.env['fs.aircraft'],
+        }
+        wanted_ids = {resource_type: set(records.ids) for resource_type, records in wanted.items()}
+        reasons = {}
+        for resource_type, student_id, instructor_id, aircraft_id, is_eligible, __, reason in rows:
+            res_id = student_id or instructor_id or aircraft_id
+            if not is_eligible and res_id in wanted_ids[resource_type]:
+                reasons[wanted[resource_type].browse(res_id)] = reason
+        return reasons
+
+    @api.model
+    def _cron_build_snapshot(self):
+        """Nightly: build the next working day's snapshot and drop past ones."""
+        today = fields.Date.context_today(self)
+        next_day = today + timedelta(days=1)
+        while next_day.weekday() >= 5:
+            next_day += timedelta(days=1)
+        self._build_snapshot(next_day)
+        self.search([('date', '<', today)]).unlink()
+
+
+class FsStudent(models.Model):
+    """Refresh eligibility snapshot rows when expiry fields change."""
+
+    _inherit = 'fs.student'  # type: ignore
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env['fs.scheduling.eligibility']._refresh_resources(students=records)
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if ELIGIBILITY_FIELDS['fs.student'].intersection(vals):
+            self.env['fs.scheduling.eligibility']._refresh_resources(students=self)
+        return res
+
+
+class FsInstructor(models.Model):
+    """Refresh eligibility snapshot rows when expiry fields change."""
+
+    _inherit = 'fs.instructor'  # type: ignore
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env['fs.scheduling.eligibility']._refresh_resources(instructors=records)
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if ELIGIBILITY_FIELDS['fs.instructor'].intersection(vals):
+            self.env['fs.scheduling.eligibility']._refresh_resources(instructors=self)
+        return res
+
+
+class FsAircraft(models.Model):
+    """Refresh eligibility snapshot rows when status or expiry fields change."""
+
+    _inherit = 'fs.aircraft'  # type: ignore
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env['fs.scheduling.eligibility']._refresh_resources(aircraft=records)
+        return records
+
+    def write(self, vals):
+        res = super().write(vals)
+        if ELIGIBILITY_FIELDS['fs.aircraft'].intersection(vals):
+            self.env['fs.scheduling.eligibility']._refresh_resources(aircraft=self)
+        return res
+
+
+class FsPersonQualification(models.Model):
+    """Refresh the instructors' snapshot rows when qualifications change."""
+
+    _inherit = 'fs.person.qualification'  # type: ignore
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env['fs.scheduling.eligibility']._refresh_resources(instructors=records.instructor_id)
+        return records
+
+    def write(self, vals):
+        instructors = self.instructor_id
+        res = super().write(vals)
+        if {'instructor_id', 'qualification_id', 'expiry_date'}.intersection(vals):
+            self.env['fs.scheduling.eligibility']._refresh_resources(
+                instructors=instructors | self.instructor_id)
+        return res
+
+    def unlink(self):
+        instructors = self.instructor_id
+        res = super().unlink()
+        self.env['fs.scheduling.eligibility']._refresh_resources(instructors=instructors.exists())
+        return res
+
+
+class FsQualificationType(models.Model):
+    """Refresh the holders' snapshot rows when the examiner flag changes."""
+
+    _inherit = 'fs.qualification.type'  # type: ignore
+
+    def write(self, vals):
+        res = super().write(vals)
+        if 'is_examinator' in vals:
+            instructors = self.env['fs.person.qualification'].search([
+                ('qualification_id', 'in', self.ids),
+                ('instructor_id', '!=', False),
+            ]).instructor_id
+            self.env['fs.scheduling.eligibility']._refresh_resources(instructors=instructors)
+        return res
+
+
+class FsInstructorAvailability(models.Model):
+    """Refresh the instructors' snapshot rows when availability changes."""
+
+    _inherit = 'fs.instructor.availability'  # type: ignore
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env['fs.scheduling.eligibility']._refresh_resources(instructors=records.instructor_id)
+        return records
+
+    def write(self, vals):
+        instructors = self.instructor_id
+        res = super().write(vals)
+        self.env['fs.scheduling.eligibility']._refresh_resources(instructors=instructors | self.instructor_id)
+        return res
+
+    def unlink(self):
+        instructors = self.instructor_id
+        res = super().unlink()
+        self.env['fs.scheduling.eligibility']._refresh_resources(instructors=instructors.exists())
+        return res
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+# Part of Flight School Management System
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+from odoo import models
+
+
+class FsStudentEnrollment(models.Model):
+    """Feed completed flights into the training graduation forecast."""
+
+    _inherit = 'fs.student.enrollment'  # type: ignore
+
+    def _get_recent_logged_hours(self, date_from):
+        """Sum completed flight time per (enrollment, activity) since ``date_from``."""
+        result = super()._get_recent_logged_hours(date_from)
+        groups = self.env['fs.scheduled.flight']._read_group(
+            domain=[
+                ('enrollment_id', 'in', self.ids),
+                ('status', '=', 'completed'),
+                ('mission_id', '!=', False),
+                ('date', '>=', date_from),
+            ],
+            groupby=['enrollment_id', 'mission_id'],
+            aggregates=['actual_duration:sum'],
+        )
+        for enrollment, mission, hours in groups:
+            key = (enrollment.id, mission.activity_id.id)  # type: ignore
+            result[key] = result.get(key, 0.0) + (hours or 0.0)
+        return result
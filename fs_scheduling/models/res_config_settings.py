@@ -28,3 +28,42 @@ class ResConfigSettings(models.TransientModel):
         config_parameter='flight_school.scheduling_time_slot_minutes',
         help="Default time slot increment for scheduling (e.g., 15 minutes).",
     )
+
+    fs_mission_duration_auto_update = fields.Boolean(
+        string='Auto-update Mission Durations',
+        config_parameter='flight_school.mission_duration_auto_update',
+        help="Weekly, replace syllabus mission durations with the median of completed flights.",
+    )
+
+    fs_currency_window_days = fields.Integer(
+        string='Currency Window (Days)',
+        default=90,
+        config_parameter='flight_school.currency_window_days',
+        help="Recent-experience window for instructor currency.",
+    )
+
+    fs_currency_min_flights = fields.Integer(
+        string='Minimum Flights',
+        default=3,
+        config_parameter='flight_school.currency_min_flights',
+        help="Completed flights required within the currency window.",
+    )
+
+    fs_currency_min_hours = fields.Float(
+        string='Minimum Hours',
+        default=0.0,
+        config_parameter='flight_school.currency_min_hours',
+        help="Flight hours required within the currency window.",
+    )
+
+    fs_currency_check_scheduling = fields.Boolean(
+        string='Require Currency for Scheduling',
+        config_parameter='flight_school.currency_check_scheduling',
+        help="Leave instructors who are not current unassigned in the scheduling wizard.",
+    )
+
+    def set_values(self):
+        super().set_values()
+        # Currency requirements may have changed
+        self.env['fs.instructor']._update_currency()
+
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+# Part of Flight School Management System
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+from datetime import timedelta
+
+from odoo import fields
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestInstructorCurrency(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        ICP = cls.env['ir.config_parameter'].sudo()
+        ICP.set_param('flight_school.currency_window_days', '90')
+        ICP.set_param('flight_school.currency_min_flights', '3')
+        ICP.set_param('flight_school.currency_min_hours', '0')
+        cls.instructor = cls.env['fs.instructor'].create({
+            'name': 'Currency Test Instructor',
+            'gender': 'male',
+        })
+        cls.today = fields.Date.context_today(cls.instructor)
+
+    def _set_buckets(self, days_ago_list):
+        Bucket = self.env['fs.instructor.currency.bucket']
+        Bucket.search([('instructor_id', '=', self.instructor.id)]).unlink()
+        Bucket.create([{
+            'instructor_id': self.instructor.id,
+            'date': self.today - timedelta(days=days_ago),
+            'flight_count': 1,
+            'flight_hours': 1.0,
+        } for days_ago in days_ago_list])
+        self.instructor._update_currency()
+
+    def test_below_min_flights_is_not_current(self):
+        """Two recent flights with a 3-flight minimum must not make the instructor current."""
+        self._set_buckets([1, 5])
+        self.assertFalse(self.instructor.is_current)
+        self.assertFalse(self.instructor.currency_expiry_date)
+
+    def test_min_flights_reached_is_current(self):
+        self._set_buckets([1, 5, 10])
+        self.assertTrue(self.instructor.is_current)
+        self.assertEqual(self.instructor.currency_expiry_date, self.today - timedelta(days=10) + timedelta(days=89))
@@ -3,3 +3,4 @@
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
 
 from . import fs_scheduling_wizard
+from . import fs_mission_duration_wizard
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+# Part of Flight School Management System
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+from odoo import api, fields, models, _
+from odoo.exceptions import UserError
+
+from ..models.fs_flight_mission import MIN_DURATION_SAMPLES
+
+
+class FsMissionDurationWizard(models.TransientModel):
+    """Review and apply mission durations estimated from completed flights."""
+
+    _name = 'fs.mission.duration.wizard'
+    _description = 'Mission Duration Re-estimation Wizard'
+
+    statistic = fields.Selection(
+        selection=[
+            ('median', 'Median'),
+            ('p80', '80th Percentile'),
+        ],
+        string='Estimate',
+        default='median',
+        required=True,
+        help="Median packs slots tightly; P80 leaves room for longer flights.",
+    )
+    min_samples = fields.Integer(
+        string='Minimum Flights',
+        default=MIN_DURATION_SAMPLES,
+        required=True,
+        help="Completed flights required before a mission is re-estimated.",
+    )
+    line_ids = fields.One2many(
+        comodel_name='fs.mission.duration.wizard.line',
+        inverse_name='wizard_id',
+        string='Estimates',
+    )
+
+    @api.onchange('statistic', 'min_samples')
+    def _onchange_load_estimates(self):
+        """Load duration statistics for all missions with enough history."""
+        Mission = self.env['fs.flight.mission']
+        lines = [(5, 0, 0)]
+        for row in Mission._get_duration_statistics(max(self.min_samples, 1)):
+            estimate = row[self.statistic]
+            is_mission_level = not row['aircraft_type_id']
+            lines.append((0, 0, {
+                'mission_id': row['mission_id'],
+                'discipline_id': row['discipline_id'],
+                'aircraft_type_id': row['aircraft_type_id'],
+                'sample_count': row['sample_count'],
+                'median_duration': row['median'],
+                'p80_duration': row['p80'],
+                'proposed_duration': Mission._round_duration_to_slot(estimate),
+                'to_apply': is_mission_level,
+            }))
+        self.line_ids = lines
+
+    def action_apply(self):
+        """Apply the selected mission-level estimates in one write."""
+        self.ensure_one()
+        durations = {
+            line.mission_id.id: line.proposed_duration  # type: ignore
+            for line in self.line_ids
+            if line.to_apply and not line.aircraft_type_id  # type: ignore
+        }
+        if not durations:
+            raise UserError(_("No mission-level estimate selected."))
+        self.env['fs.flight.mission']._apply_duration_estimates(durations)
+        return {'type': 'ir.actions.act_window_close'}
+
+
+class FsMissionDurationWizardLine(models.TransientModel):
+    _name = 'fs.mission.duration.wizard.line'
+    _description = 'Mission Duration Estimate'
+    _order = 'mission_id, aircraft_type_id desc'
+
+    wizard_id = fields.Many2one('fs.mission.duration.wizard', ondelete='cascade')
+    mission_id = fields.Many2one('fs.flight.mission', string='Mission', required=True)
+    discipline_id = fields.Many2one('fs.flight.discipline', string='Discipline')
+    aircraft_type_id = fields.Many2one(
+        'fs.aircraft.type',
+        string='Aircraft Type',
+        help="Empty for the estimate across all aircraft types (the one that can be applied).",
+    )
+    sample_count = fields.Integer(string='Flights')
+    current_duration = fields.Float(related='mission_id.duration_hours', string='Current')
+    median_duration = fields.Float(string='Median')
+    p80_duration = fields.Float(string='P80')
+    proposed_duration = fields.Float(string='Proposed')
+    to_apply = fields.Boolean(string='Apply')
@@ -60,11 +60,12 @@ class FsSchedulingWizard(models.TransientModel):
         if not self.date:
             return
 
-        # Eligibility check: active enrollment + no expiries
+        # Eligibility comes from the precomputed daily snapshot
+        eligible = self.env['fs.scheduling.eligibility']._get_eligible_ids(self.date)
         enrollments = self.env['fs.student.enrollment'].search([
             ('status', '=', 'active'),
             ('progression', '<', 100.0),
-            ('has_expired_status', '=', False),
+            ('student_id', 'in', list(eligible['student'])),
         ])
 
         lines = []
@@ -76,12 +77,26 @@ class FsSchedulingWizard(models.TransientModel):
 
             lines.append((0, 0, {
                 'enrollment_id': enrollment.id,
-                'instructor_id': enrollment.instructor_id.id, # type: ignore
+                'instructor_id': enrollment.instructor_id.id if enrollment.instructor_id.id in eligible['instructor'] else False, # type: ignore
                 'mission_id': mission.id if mission else False,
                 'duration': mission.duration_hours if mission else 1.0,
             }))
         self.line_ids = lines
 
+    def action_refresh_eligibility(self):
+        """Rebuild the eligibility snapshot of the date and reload the students."""
+        self.ensure_one()
+        self.env['fs.scheduling.eligibility']._build_snapshot(self.date)
+        self.line_ids = [(5, 0, 0)]
+        self._onchange_date_load_students()
+        return {
+            'type': 'ir.actions.act_window',
+            'res_model': self._name,
+            'res_id': self.id,
+            'view_mode': 'form',
+            'target': 'new',
+        }
+
     def action_schedule(self):
         self.ensure_one()
         if not self.line_ids:
@@ -129,29 +144,57 @@ class FsSchedulingWizardLine(models.TransientModel):
     wizard_id = fields.Many2one('fs.scheduling.wizard', ondelete='cascade')
     enrollment_id = fields.Many2one('fs.student.enrollment', string='Student/Class', required=True)
     student_id = fields.Many2one(related='enrollment_id.student_id', string='Student')
-    instructor_id = fields.Many2one('fs.instructor', string='Instructor')
-    aircraft_id = fields.Many2one('fs.aircraft', string='Aircraft', domain=[('is_airworthy', '=', True)])
+    instructor_id = fields.Many2one(
+        'fs.instructor', string='Instructor',
+        domain="[('id', 'in', allowed_instructor_ids)]",
+    )
+    aircraft_id = fields.Many2one(
+        'fs.aircraft', string='Aircraft',
+        domain="[('id', 'in', allowed_aircraft_ids)]",
+    )
     mission_id = fields.Many2one('fs.flight.mission', string='Mission')
     duration = fields.Float(string='Duration', default=1.0)
     start_time = fields.Float(string='Start Time', default=8.0)
     is_solo = fields.Boolean(string='Solo')
+    allowed_instructor_ids = fields.Many2many(
+        comodel_name='fs.instructor',
+        compute='_compute_allowed_resources',
+        help="Eligible instructors on the wizard date (examiners only for exam missions).",
+    )
+    allowed_aircraft_ids = fields.Many2many(
+        comodel_name='fs.aircraft',
+        compute='_compute_allowed_resources',
+        help="Eligible aircraft on the wizard date, restricted to the class aircraft types.",
+    )
+
+    @api.depends('wizard_id.date', 'enrollment_id', 'mission_id')
+    def _compute_allowed_resources(self):
+        """Read the eligibility snapshot once per date for all lines."""
+        Eligibility = self.env['fs.scheduling.eligibility']
+        snapshots = {}
+        for line in self:
+            date = line.wizard_id.date  # type: ignore
+            if not date:
+                line.allowed_instructor_ids = False
+                line.allowed_aircraft_ids = False
+                continue
+            if date not in snapshots:
+                snapshots[date] = Eligibility._get_eligible_ids(date)
+            eligible = snapshots[date]
+            line.allowed_instructor_ids = list(
+                eligible['examiner'] if line.mission_id.is_exam else eligible['instructor'])  # type: ignore
+            aircraft = self.env['fs.aircraft'].browse(eligible['aircraft'])
+            aircraft_types = line.enrollment_id.training_class_id.aircraft_type_ids  # type: ignore
+            if aircraft_types:
+                aircraft = aircraft.filtered(lambda a: a.aircraft_type_id in aircraft_types)
+            line.allowed_aircraft_ids = aircraft
 
     @api.onchange('enrollment_id')
     def _onchange_enrollment(self):
         if self.enrollment_id:
             self.instructor_id = self.enrollment_id.instructor_id  # type: ignore
-            # Filter aircraft types allowed for this class
-            class_rec = self.enrollment_id.training_class_id  # type: ignore
-            if class_rec.aircraft_type_ids:
-                return {'domain': {'aircraft_id': [
-                    ('is_airworthy', '=', True),
-                    ('aircraft_type_id', 'in', class_rec.aircraft_type_ids.ids)
-                ]}}
 
     @api.onchange('mission_id')
     def _onchange_mission(self):
         if self.mission_id:
             self.duration = self.mission_id.duration_hours  # type: ignore
-            if self.mission_id.is_exam:  # type: ignore
-                # Filter instructors who are examinators
-                return {'domain': {'instructor_id': [('qualification_ids.qualification_id.is_examinator', '=', True)]}}
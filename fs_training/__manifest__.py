@@ -4,7 +4,7 @@
 
 {
     'name': 'Flight School Training',
-    'version': '19.0.1.0.0',
+    'version': '19.0.1.0.1',
     'category': 'Aviation/Flight School',
     'summary': 'Training classes, enrollments, and flight missions',
     'description': """
@@ -31,6 +31,9 @@ This module provides:
         'fs_fleet',
         'mail',
     ],
+    'external_dependencies': {
+        'python': ['numpy'],
+    },
     'data': [
         # Security
         'security/ir.model.access.csv',
@@ -40,6 +43,7 @@ This module provides:
         'data/fs_flight_activity_data.xml',
         'data/fs_class_type_data.xml',
         'data/fs_class_type_hours_data.xml',
+        'data/fs_training_cron.xml',
         # Views - Configuration
         'views/fs_flight_discipline_views.xml',
         'views/fs_flight_type_views.xml',
@@ -59,6 +63,10 @@ This module provides:
     'assets': {
         'web.assets_backend': [
             'fs_training/static/src/js/progress_bar_patch.js',
+            'fs_training/static/src/js/hours_matrix_field.js',
+            'fs_training/static/src/xml/hours_matrix_field.xml',
+            'fs_training/static/src/js/remaining_breakdown_field.js',
+            'fs_training/static/src/xml/remaining_breakdown_field.xml',
         ],
     },
     'demo': [
@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+# Part of Flight School Management System
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+from odoo import SUPERUSER_ID, api
+
+
+def migrate(cr, version):
+    """Recount instructor student loads, enrolled students now count too."""
+    env = api.Environment(cr, SUPERUSER_ID, {})
+    instructors = env['fs.instructor'].with_context(active_test=False).search([])
+    for field_name in ('assigned_student_count', 'student_capacity_reached'):
+        env.add_to_compute(instructors._fields[field_name], instructors)
+    env.flush_all()
@@ -13,4 +13,5 @@ from . import fs_training_class
 from . import fs_student_enrollment
 from . import fs_student
 from . import fs_instructor
+from . import fs_personnel_search
 from . import fs_training_dashboard
@@ -4,6 +4,9 @@
 
 from odoo import api, fields, models
 
+# Enrollment statuses that count towards an instructor's student load
+STUDENT_LOAD_STATUSES = ('enrolled', 'active')
+
 
 class FsInstructor(models.Model):
     """Extend instructor model with training-specific student assignment logic."""
@@ -18,30 +21,40 @@ class FsInstructor(models.Model):
     assigned_student_count = fields.Integer(
         string='Assigned Students',
         compute='_compute_assigned_student_count',
-        help="Number of active students currently assigned to this instructor.",
+        store=True,
+        help="Number of enrolled or active students currently assigned to this instructor.",
     )
     student_capacity_reached = fields.Boolean(
         string='Capacity Reached',
         compute='_compute_assigned_student_count',
+        store=True,
         help="True if the instructor has reached their maximum student limit.",
     )
 
     @api.depends('max_students', 'enrollment_ids.status')
     def _compute_assigned_student_count(self):
-        """Compute count of active students assigned to this instructor."""
+        """Count enrolled and active students per instructor with one grouped query."""
+        counts = dict(self.env['fs.student.enrollment']._read_group(
+            domain=[
+                ('instructor_id', 'in', self._origin.ids),
+                ('status', 'in', STUDENT_LOAD_STATUSES),
+            ],
+            groupby=['instructor_id'],
+            aggregates=['__count'],
+        ))
         for record in self:
-            count = len(record.enrollment_ids.filtered(lambda e: e.status == 'active'))
+            count = counts.get(record._origin, 0)
             record.assigned_student_count = count
             record.student_capacity_reached = count >= record.max_students
 
     def action_view_assigned_students(self):
-        """Open list of active students assigned to this instructor."""
+        """Open list of enrolled and active students assigned to this instructor."""
         self.ensure_one()
         return {
             'type': 'ir.actions.act_window',
             'name': f'Students assigned to {self.display_name}',
             'res_model': 'fs.student.enrollment',
             'view_mode': 'list,form',
-            'domain': [('instructor_id', '=', self.id), ('status', '=', 'active')],
+            'domain': [('instructor_id', '=', self.id), ('status', 'in', STUDENT_LOAD_STATUSES)],
             'context': {'default_instructor_id': self.id},
         }
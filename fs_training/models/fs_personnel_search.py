@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+# Part of Flight School Management System
+# License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
+
+from odoo import api, models
+from odoo.tools import SQL
+
+
+class FsPersonnelSearch(models.AbstractModel):
+    """Resolve students by the callsign of any of their enrollments."""
+
+    _inherit = 'fs.personnel.search'
+
+    @api.model
+    def _get_personnel_search_branches(self, pattern):
+        branches = super()._get_personnel_search_branches(pattern)
+        Enrollment = self.env['fs.student.enrollment']
+        if Enrollment.has_access('read') and self.env['fs.student'].has_access('read'):
+            Enrollment.flush_model(['callsign', 'student_id'])
+            branches.append(SQL("""
+                SELECT 'fs.student' AS model, s.id AS res_id, s.name, e.callsign,
+                       s.service_number, s.identification_number
+                  FROM fs_student_enrollment e
+                  JOIN fs_student s ON s.id = e.student_id
+                 WHERE s.active
+                   AND e.callsign ILIKE %s
+            """, pattern))
+        return branches
@@ -2,9 +2,16 @@
 # Part of Flight School Management System
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
 
+from datetime import timedelta
+
+import numpy as np
+
 from odoo import api, fields, models
 from odoo.exceptions import ValidationError, UserError
 
+# Recent window used to fit each activity's hours-logged rate
+FORECAST_WINDOW_DAYS = 28
+
 
 class FsStudentEnrollment(models.Model):
     """Student enrollment in a training class."""
@@ -44,6 +51,7 @@ class FsStudentEnrollment(models.Model):
     )
     callsign = fields.Char(
         string='Callsign',
+        index='trigram',
         help="Student's callsign for this class. Auto-suggested as ClassCode + Letter (e.g., CPL24A).",
     )
 
@@ -269,9 +277,20 @@ class FsStudentEnrollment(models.Model):
         compute='_compute_remaining_hours',
         help="Total hours remaining to complete the mandatory syllabus requirements.",
     )
-    remaining_breakdown_html = fields.Html(
+    forecast_end_date = fields.Date(
+        string='Forecast Completion',
+        readonly=True,
+        help="Projected syllabus completion date, refreshed nightly from the hours-logged rate.",
+    )
+    forecast_late = fields.Boolean(
+        string='Forecast Late',
+        readonly=True,
+        help="True if the projected completion falls after the class expected end date.",
+    )
+    remaining_breakdown = fields.Json(
         string='Remaining Breakdown',
-        compute='_compute_remaining_breakdown_html',
+        compute='_compute_remaining_breakdown',
+        help="Incomplete mandatory activities as [activity id, name, remaining, progress].",
     )
 
     @api.depends('status')
@@ -325,45 +344,104 @@ class FsStudentEnrollment(models.Model):
                 if req.minimum_hours > req.hours_logged:  # type: ignore
                     remaining += (req.minimum_hours - req.hours_logged)  # type: ignore
             record.remaining_hours = remaining
-    @api.depends('required_hour_ids.hours_logged', 'required_hour_ids.minimum_hours', 'required_hour_ids.activity_id')
-    def _compute_remaining_breakdown_html(self):
-        """Generate a pretty HTML summary of remaining hours per activity."""
+
+    @api.depends('required_hour_ids.hours_logged', 'required_hour_ids.minimum_hours',
+                 'required_hour_ids.activity_id.name')
+    def _compute_remaining_breakdown(self):
+        """Compact per-activity remaining hours, rendered client-side.
+
+        Sorting and formatting are left to the widget to keep the payload
+        small and the per-row server work minimal.
+        """
         for record in self:
-            # Filter for incomplete mandatory items
-            incomplete = record.required_hour_ids.filtered(lambda x: x.remaining_hours > 0) # type: ignore
-            if not incomplete:
-                record.remaining_breakdown_html = '<span class="text-success small"><i class="fa fa-check-circle"/> Syllabus Fully Completed</span>'
-                continue
-            
-            # Sort by most hours remaining (most critical)
-            incomplete = sorted(incomplete, key=lambda x: x.remaining_hours, reverse=True) # type: ignore
-            
-            html = '<div class="d-flex flex-column gap-1">'
-            # Show top 3 most critical activities
-            for req in incomplete[:3]:
-                # Extract values and format as float_time (HH:MM)
-                act_name = req.activity_id.name  # type: ignore
-                rem_h = req.remaining_hours  # type: ignore
-                hours, minutes = divmod(abs(rem_h) * 60, 60)
-                rem_h_fmt = f"{int(hours)}:{int(minutes):02d}"
-                
-                # Determine color based on completion
-                progress = req.progress_percentage # type: ignore
-                color = "text-danger" if progress < 50 else "text-warning"
-                
-                html += f'''
-                    <div class="d-flex justify-content-between align-items-center small" style="min-width: 220px;">
-                        <span class="text-muted text-truncate me-2" style="max-width: 170px;" title="{act_name}">{act_name}</span>
-                        <strong class="{color}">{rem_h_fmt} left</strong>
-                    </div>
-                '''
-            
-            # Add and more if needed
-            if len(incomplete) > 3:
-                html += f'<div class="text-muted x-small italic text-center text-decoration-underline mt-1">+{len(incomplete)-3} more activities...</div>'
-            
-            html += '</div>'
-            record.remaining_breakdown_html = html
+            record.remaining_breakdown = [
+                [line.activity_id.id, line.activity_id.name, line.minimum_hours - line.hours_logged,  # type: ignore
+                 line.progress_percentage]  # type: ignore
+                for line in record.required_hour_ids
+                if line.minimum_hours > line.hours_logged  # type: ignore
+            ]
+
+    # === Graduation Forecast ===
+
+    @api.model
+    def _cron_forecast_graduation(self):
+        """Nightly refresh of the graduation forecast for all active enrollments."""
+        self.search([('status', '=', 'active')])._forecast_graduation()
+
+    def _get_recent_logged_hours(self, date_from):
+        """Return hours flown since ``date_from`` as {(enrollment_id, activity_id): hours}.
+
+        No flight log exists at the training level; the scheduling module
+        overrides this with completed flights. Without history the forecast
+        falls back to the average rate since the class start.
+        """
+        return {}
+
+    def _forecast_graduation(self):
+        """Project a completion date per mandatory activity and per enrollment.
+
+        All hour lines of the recordset are evaluated in one vectorized pass,
+        then stored with one write per distinct value.
+        """
+        if not self:
+            return
+        today = fields.Date.context_today(self)
+        lines = self.env['fs.enrollment.hours'].search([
+            ('enrollment_id', 'in', self.ids),
+            ('is_extra', '=', False),
+        ])
+        recent = self._get_recent_logged_hours(today - timedelta(days=FORECAST_WINDOW_DAYS))
+
+        enrollment_index = {enrollment_id: i for i, enrollment_id in enumerate(self.ids)}
+        line_enrollment = np.array([enrollment_index[line.enrollment_id.id] for line in lines], dtype=np.int64)
+        logged = np.array(lines.mapped('hours_logged'), dtype=np.float64)
+        minimum = np.array(lines.mapped('minimum_hours'), dtype=np.float64)
+        recent_hours = np.array([
+            recent.get((line.enrollment_id.id, line.activity_id.id), 0.0) for line in lines
+        ], dtype=np.float64)
+        elapsed = np.array([
+            max((today - enrollment.enrollment_date).days, 0) if enrollment.enrollment_date else 0
+            for enrollment in self
+        ], dtype=np.float64)[line_enrollment]
+
+        # Fit the daily rate on the recent window, fall back to the lifetime average
+        lifetime_rate = np.divide(logged, elapsed, out=np.zeros_like(logged), where=elapsed > 0)
+        rate = np.where(recent_hours > 0, recent_hours / FORECAST_WINDOW_DAYS, lifetime_rate)
+        remaining = np.maximum(minimum - logged, 0.0)
+        pending = remaining > 0
+        projectable = pending & (rate > 0)
+        days_needed = np.zeros_like(remaining)
+        np.divide(remaining, rate, out=days_needed, where=projectable)
+        days_needed = np.ceil(days_needed).astype(np.int64)
+
+        # Per enrollment: latest activity completion, or "never" if any pending activity has no rate
+        last_day = np.zeros(len(self), dtype=np.int64)
+        np.maximum.at(last_day, line_enrollment, days_needed)
+        blocked = np.zeros(len(self), dtype=bool)
+        np.logical_or.at(blocked, line_enrollment, pending & ~projectable)
+
+        line_groups = {}
+        for line, is_projectable, days in zip(lines, projectable, days_needed):
+            forecast = today + timedelta(days=int(days)) if is_projectable else False
+            line_groups.setdefault(forecast, []).append(line.id)
+        for forecast, line_ids in line_groups.items():
+            self.env['fs.enrollment.hours'].browse(line_ids).write({'forecast_date': forecast})
+
+        enrollment_groups = {}
+        for enrollment, days, is_blocked in zip(self, last_day, blocked):
+            forecast = False if is_blocked else today + timedelta(days=int(days))
+            expected_end = enrollment.training_class_id.expected_end_date  # type: ignore
+            late = bool(expected_end) and (is_blocked or forecast > expected_end)
+            enrollment_groups.setdefault((forecast, late), []).append(enrollment.id)
+        for (forecast, late), enrollment_ids in enrollment_groups.items():
+            self.browse(enrollment_ids).write({
+                'forecast_end_date': forecast,
+                'forecast_late': late,
+            })
+
+    def action_forecast_graduation(self):
+        """Refresh the graduation forecast of the selected enrollments now."""
+        self.filtered(lambda e: e.status == 'active')._forecast_graduation()
 
     @api.constrains('student_id', 'status')
     def _check_one_active_enrollment(self):
@@ -500,6 +578,11 @@ class FsEnrollmentHours(models.Model):
         string='Remaining',
         compute='_compute_remaining_hours_line',
     )
+    forecast_date = fields.Date(
+        string='Forecast',
+        readonly=True,
+        help="Projected completion date of this activity at the current hours-logged rate.",
+    )
 
     @api.depends('hours_logged', 'minimum_hours')
     def _compute_remaining_hours_line(self):
@@ -2,9 +2,11 @@
 # Part of Flight School Management System
 # License LGPL-3.0 or later (https://www.gnu.org/licenses/lgpl-3.0).
 
+import heapq
 from datetime import date, timedelta
 from odoo import api, fields, models
-from odoo.exceptions import ValidationError
+from odoo.exceptions import UserError, ValidationError
+from .fs_instructor import STUDENT_LOAD_STATUSES
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -157,6 +159,12 @@ class FsTrainingClass(models.Model):
         store=True,
         help="Average student progression.",
     )
+    hours_matrix_data = fields.Json(
+        string='Hours Matrix',
+        compute='_compute_hours_matrix_data',
+        store=True,
+        help="Enrollment x activity grid of logged, minimum and remaining hours.",
+    )
 
     notes = fields.Text(
         string='Notes',
@@ -254,6 +262,57 @@ class FsTrainingClass(models.Model):
             else:
                 record.progress_percentage = 0.0
 
+    @api.depends('enrollment_ids.callsign', 'enrollment_ids.student_name',
+                 'enrollment_ids.required_hour_ids.hours_logged',
+                 'enrollment_ids.required_hour_ids.minimum_hours',
+                 'enrollment_ids.required_hour_ids.activity_id.code',
+                 'enrollment_ids.required_hour_ids.activity_id.name')
+    def _compute_hours_matrix_data(self):
+        """Build the class hours matrix from a single grouped query.
+
+        Stored, so the grid is only rebuilt when an hour line of the class
+        or one of its activities changes instead of on every render.
+        """
+        classes = self.filtered('id')
+        cells = {}
+        activities = {}
+        if classes:
+            groups = self.env['fs.enrollment.hours']._read_group(
+                domain=[
+                    ('enrollment_id.training_class_id', 'in', classes.ids),
+                    ('is_extra', '=', False),
+                ],
+                groupby=['enrollment_id', 'activity_id'],
+                aggregates=['hours_logged:sum', 'minimum_hours:sum'],
+            )
+            for enrollment, activity, logged, minimum in groups:
+                activities[activity.id] = activity
+                cells.setdefault(enrollment.id, {})[str(activity.id)] = [
+                    logged,
+                    minimum,
+                    max(0.0, minimum - logged),
+                ]
+
+        columns = [
+            {'id': activity.id, 'code': activity.code or activity.name}
+            for activity in sorted(activities.values(), key=lambda a: a.code or '')
+        ]
+        for record in self:
+            if record not in classes:
+                record.hours_matrix_data = False
+                continue
+            rows = [{
+                'id': enrollment.id,
+                'callsign': enrollment.callsign or '',
+                'student': enrollment.student_name or '',
+                'cells': cells.get(enrollment.id, {}),
+            } for enrollment in record.enrollment_ids]
+            used = {key for row in rows for key in row['cells']}
+            record.hours_matrix_data = {
+                'activities': [col for col in columns if str(col['id']) in used],
+                'rows': rows,
+            }
+
     @api.onchange('class_type_id')
     def _onchange_class_type_id(self):
         """Copy aircraft types and admin tasks from class type."""
@@ -346,6 +405,111 @@ class FsTrainingClass(models.Model):
                     students.write({'active': False})  # type: ignore
         return result
 
+    def action_view_hours_matrix(self):
+        """Open the student x activity hours matrix of this class."""
+        self.ensure_one()
+        return {
+            'name': f'Hours Matrix - {self.name}',
+            'type': 'ir.actions.act_window',
+            'res_model': 'fs.training.class',
+            'res_id': self.id,
+            'view_mode': 'form',
+            'view_id': self.env.ref('fs_training.view_training_class_hours_matrix').id,
+            'target': 'new',
+            'context': {'dialog_size': 'extra-large'},
+        }
+
+    def action_assign_instructors(self):
+        """Distribute unassigned enrollments across eligible instructors.
+
+        Respects each instructor's ``max_students`` and current load, and
+        prefers instructors with the lowest utilisation and rolling hours.
+        """
+        self.ensure_one()
+        enrollments = self.enrollment_ids.filtered_domain([
+            ('status', 'in', STUDENT_LOAD_STATUSES),
+            ('instructor_id', '=', False),
+        ])
+        if not enrollments:
+            raise UserError("All enrolled students already have an assigned instructor.")
+
+        instructors = self.env['fs.instructor'].search([
+            ('has_expired_qualification', '=', False),
+            ('student_capacity_reached', '=', False),
+            ('max_students', '>', 0),
+        ])
+        # Same load definition as the capacity filter above
+        load = {instructor.id: instructor.assigned_student_count for instructor in instructors}
+        assignment = self._solve_instructor_assignment(enrollments, instructors, load)
+        if not assignment:
+            raise UserError("No eligible instructor has remaining student capacity.")
+
+        by_instructor = {}
+        for enrollment_id, instructor_id in assignment.items():
+            by_instructor.setdefault(instructor_id, []).append(enrollment_id)
+        Enrollment = self.env['fs.student.enrollment']
+        for instructor_id, enrollment_ids in by_instructor.items():
+            Enrollment.browse(enrollment_ids).write({'instructor_id': instructor_id})
+
+        unassigned = len(enrollments) - len(assignment)
+        message = f"{len(assignment)} student(s) assigned to {len(by_instructor)} instructor(s)."
+        if unassigned:
+            message += f" {unassigned} student(s) left unassigned: instructor capacity reached."
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': 'Instructor Assignment',
+                'message': message,
+                'type': 'warning' if unassigned else 'success',
+                'next': {'type': 'ir.actions.act_window_close'},
+            },
+        }
+
+    @api.model
+    def _solve_instructor_assignment(self, enrollments, instructors, load):
+        """Min-cost assignment of enrollments to instructor capacity slots.
+
+        Modelled as a min-cost flow from students to instructors where the
+        cost of an instructor's k-th slot is its utilisation after taking it
+        plus its rolling 3-month hours ratio. Every student may use every
+        eligible instructor, so arc costs only depend on the instructor side
+        and are convex in k: successively taking the cheapest open slot from a
+        heap yields the optimal flow in O(n log m).
+
+        Args:
+            enrollments: fs.student.enrollment records to assign
+            instructors: eligible fs.instructor records
+            load: dict {instructor_id: current student count}
+
+        Returns:
+            dict {enrollment_id: instructor_id}
+        """
+        heap = []
+        for instructor in instructors:
+            taken = load.get(instructor.id, 0)
+            if taken >= instructor.max_students:
+                continue
+            hours_ratio = (
+                instructor.hours_3months / instructor.max_hours_per_3months
+                if instructor.max_hours_per_3months > 0 else 0.0
+            )
+            heap.append(((taken + 1) / instructor.max_students + hours_ratio, instructor.id, taken, hours_ratio))
+        heapq.heapify(heap)
+
+        capacity = {instructor.id: instructor.max_students for instructor in instructors}
+        assignment = {}
+        for enrollment in enrollments:
+            if not heap:
+                break
+            __, instructor_id, taken, hours_ratio = heapq.heappop(heap)
+            assignment[enrollment.id] = instructor_id
+            taken += 1
+            if taken < capacity[instructor_id]:
+                next_cost = (taken + 1) / capacity[instructor_id] + hours_ratio
+                heapq.heappush(heap, (next_cost, instructor_id, taken, hours_ratio))
+        return assignment
+
     def action_start_class(self):
         """Start the training class."""
         for record in self:
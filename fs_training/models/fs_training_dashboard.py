@@ -62,6 +62,10 @@ class FsTrainingDashboard(models.TransientModel):
         string='Enrolled (Pending)',
         compute='_compute_enrollment_kpis',
     )
+    enrollment_forecast_late = fields.Integer(
+        string='Forecast Late',
+        compute='_compute_enrollment_kpis',
+    )
 
     # === Admin Task KPIs ===
     admin_tasks_pending = fields.Integer(
@@ -103,6 +107,10 @@ class FsTrainingDashboard(models.TransientModel):
             record.enrollment_enrolled = Enrollment.search_count([
                 ('status', '=', 'enrolled'),
             ])
+            record.enrollment_forecast_late = Enrollment.search_count([
+                ('status', '=', 'active'),
+                ('forecast_late', '=', True),
+            ])
 
     def _compute_summary_kpis(self):
         """Compute top-level summary statistics."""
@@ -196,6 +204,16 @@ class FsTrainingDashboard(models.TransientModel):
             'domain': [('status', '=', 'active')],
         }
 
+    def action_view_enrollments_forecast_late(self):
+        """Open active enrollments projected to finish after their class end date."""
+        return {
+            'name': 'Forecast Late Students',
+            'type': 'ir.actions.act_window',
+            'res_model': 'fs.student.enrollment',
+            'view_mode': 'list,form',
+            'domain': [('status', '=', 'active'), ('forecast_late', '=', True)],
+        }
+
     def action_view_enrollments_enrolled(self):
         """Open pending enrollments."""
         return {
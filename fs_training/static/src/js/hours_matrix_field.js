@@ -0,0 +1,45 @@
+/** @odoo-module **/
+
+import { Component } from "@odoo/owl";
+import { registry } from "@web/core/registry";
+import { formatFloatTime } from "@web/views/fields/formatters";
+import { standardFieldProps } from "@web/views/fields/standard_field_props";
+
+/**
+ * Renders the stored class hours matrix (rows = enrollments,
+ * columns = flight activities, cells = logged / minimum / remaining).
+ */
+export class HoursMatrixField extends Component {
+    static template = "fs_training.HoursMatrixField";
+    static props = { ...standardFieldProps };
+
+    get matrix() {
+        return this.props.record.data[this.props.name] || { activities: [], rows: [] };
+    }
+
+    getCell(row, activity) {
+        return row.cells[String(activity.id)];
+    }
+
+    formatHours(value) {
+        return formatFloatTime(value || 0);
+    }
+
+    cellClass(cell) {
+        if (!cell) {
+            return "text-muted";
+        }
+        const [logged, minimum, remaining] = cell;
+        if (remaining <= 0) {
+            return "table-success";
+        }
+        return minimum > 0 && logged / minimum < 0.5 ? "table-danger" : "table-warning";
+    }
+}
+
+export const hoursMatrixField = {
+    component: HoursMatrixField,
+    supportedTypes: ["json"],
+};
+
+registry.category("fields").add("fs_hours_matrix", hoursMatrixField);
@@ -0,0 +1,42 @@
+/** @odoo-module **/
+
+import { Component } from "@odoo/owl";
+import { registry } from "@web/core/registry";
+import { formatFloatTime } from "@web/views/fields/formatters";
+import { standardFieldProps } from "@web/views/fields/standard_field_props";
+
+const MAX_VISIBLE = 3;
+
+/**
+ * Renders the compact remaining-hours payload of an enrollment:
+ * [[activity_id, name, remaining, progress], ...].
+ * The most critical activities (most hours left) are shown first.
+ */
+export class RemainingBreakdownField extends Component {
+    static template = "fs_training.RemainingBreakdownField";
+    static props = { ...standardFieldProps };
+
+    get items() {
+        const data = this.props.record.data[this.props.name] || [];
+        return [...data].sort((a, b) => b[2] - a[2]);
+    }
+
+    get visibleItems() {
+        return this.items.slice(0, MAX_VISIBLE);
+    }
+
+    get hiddenCount() {
+        return Math.max(0, this.items.length - MAX_VISIBLE);
+    }
+
+    formatHours(value) {
+        return formatFloatTime(Math.abs(value));
+    }
+}
+
+export const remainingBreakdownField = {
+    component: RemainingBreakdownField,
+    supportedTypes: ["json"],
+};
+
+registry.category("fields").add("fs_remaining_breakdown", remainingBreakdownField);